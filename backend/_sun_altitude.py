@@ -0,0 +1,87 @@
+"""
+Sun altitude helpers shared by the sunrise/sunset experiment scripts
+"""
+import swisseph as swe
+import math
+
+# Degree/radian conversion factors, multiplied in directly in the kernels
+_D2R = math.pi / 180.0
+_R2D = 180.0 / math.pi
+
+def altitude_from_gmst(gmst, ra, dec, sin_phi, cos_phi, longitude):
+    """Altitude in degrees of a body at (ra, dec) for a given Greenwich Mean
+    Sidereal Time, all angles in degrees; the observer's latitude phi comes
+    in as its sine and cosine so sweeps can compute them once"""
+    # Local sidereal time
+    lst = gmst + longitude
+
+    # Hour angle
+    hour_angle = lst - ra
+
+    # Convert to radians
+    dec_rad = dec * _D2R
+    ha_rad = hour_angle * _D2R
+
+    # Calculate altitude
+    sin_alt = (sin_phi * math.sin(dec_rad) +
+               cos_phi * math.cos(dec_rad) * math.cos(ha_rad))
+
+    # Clamp to avoid math errors
+    sin_alt = max(-1.0, min(1.0, sin_alt))
+    return math.asin(sin_alt) * _R2D
+
+def latitude_terms(latitude):
+    """(sin, cos) of a latitude in degrees, for altitude_from_gmst"""
+    lat_rad = latitude * _D2R
+    return math.sin(lat_rad), math.cos(lat_rad)
+
+# Earth's rotation in sidereal degrees per day of UT
+_SIDEREAL_DEG_PER_DAY = 360.98564736629
+
+def gmst_degrees(jd):
+    """Greenwich Mean Sidereal Time in degrees for a UT Julian Day
+    (IAU 1982 polynomial, Meeus eq. 12.4); within ~0.005° of swe.sidtime"""
+    d = jd - 2451545.0
+    t = d / 36525.0
+    return (280.46061837 + _SIDEREAL_DEG_PER_DAY * d
+            + 0.000387933 * t * t - t * t * t / 38710000.0) % 360
+
+def sun_altitude(jd, ra, dec, latitude, longitude):
+    """Calculate sun altitude above horizon"""
+    sin_phi, cos_phi = latitude_terms(latitude)
+    return altitude_from_gmst(gmst_degrees(jd), ra, dec, sin_phi, cos_phi, longitude)
+
+def sun_altitudes(jds, latitude, longitude):
+    """Sun altitudes in degrees at each of the Julian Days jds, fetching the
+    equatorial positions for the whole batch in one pass"""
+    positions = [swe.calc_ut(jd, swe.SUN, swe.FLG_SWIEPH | swe.FLG_EQUATORIAL)[0] for jd in jds]
+    # Sidereal time advances linearly over a sweep; the T^2 term is negligible
+    gmst0 = gmst_degrees(jds[0])
+    gmsts = [gmst0 + _SIDEREAL_DEG_PER_DAY * (jd - jds[0]) for jd in jds]
+    sin_phi, cos_phi = latitude_terms(latitude)
+    return [altitude_from_gmst(gmst, pos[0], pos[1], sin_phi, cos_phi, longitude)
+            for gmst, pos in zip(gmsts, positions)]
+
+def horizon_crossing(jd_guess, rising, latitude, longitude, horizon=-0.833, refinements=1):
+    """UT Julian Day near jd_guess at which the Sun crosses the given altitude,
+    rising or setting, or None if it stays above or below it all day.
+
+    Solves cos(H0) = (sin(h) - sin(phi)sin(dec)) / (cos(phi)cos(dec)) for the
+    hour angle with the Sun's position held fixed, then re-solves with the
+    position at each new estimate."""
+    sin_phi, cos_phi = latitude_terms(latitude)
+    sin_horizon = math.sin(horizon * _D2R)
+    jd = jd_guess
+    for _ in range(refinements + 1):
+        ra, dec = swe.calc_ut(jd, swe.SUN, swe.FLG_SWIEPH | swe.FLG_EQUATORIAL)[0][:2]
+        dec_rad = dec * _D2R
+        cos_h0 = (sin_horizon - sin_phi * math.sin(dec_rad)) / (cos_phi * math.cos(dec_rad))
+        if abs(cos_h0) > 1:
+            return None  # Polar day or night
+        h0 = math.acos(cos_h0) * _R2D
+        
+        # Rising at hour angle -H0, setting at +H0; step to the nearest
+        # instant whose sidereal time puts the Sun there
+        target_gmst = ra + (-h0 if rising else h0) - longitude
+        jd += ((target_gmst - gmst_degrees(jd) + 180) % 360 - 180) / _SIDEREAL_DEG_PER_DAY
+    return jd
@@ -1,10 +1,16 @@
 """
 FastAPI main application for Panchangam Calendar API
 """
+import logging
+from datetime import date, datetime, time
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from app.routers import panchangam
 from app.models.panchangam import PanchangamRequest, PanchangamResponse
+from app.services.hindu_calendar import calculate_all_periods_for_hindu_day
+from app.utils.constants import DEFAULT_COORDINATES
+
+logger = logging.getLogger(__name__)
 
 # Create FastAPI app instance
 app = FastAPI(
@@ -32,6 +38,18 @@ app.add_middleware(
 # Include routers
 app.include_router(panchangam.router, prefix="/api", tags=["panchangam"])
 
+@app.on_event("startup")
+def warm_up_calculations():
+    """Run one periods calculation so the first request doesn't pay the cold-start cost.
+    
+    Uses today's midnight, as requests parse their date, so the result also
+    lands in the periods cache under the key a request for today will use."""
+    latitude, longitude = DEFAULT_COORDINATES
+    try:
+        calculate_all_periods_for_hindu_day(datetime.combine(date.today(), time()), latitude, longitude)
+    except Exception:
+        logger.exception("Calculation warm-up failed")
+
 # Health check endpoint
 @app.get("/")
 async def root():
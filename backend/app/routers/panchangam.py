@@ -1,6 +1,7 @@
 """
 FastAPI router for Panchangam calculations
 """
+import logging
 from fastapi import APIRouter, HTTPException, status
 from datetime import datetime, date, timedelta
 from app.models.panchangam import (
@@ -9,14 +10,15 @@ from app.models.panchangam import (
     PeriodRequest, PeriodsResponse, PeriodDetail
 )
 from app.services.astronomical import calculate_sunrise_sunset, calculate_moonrise_moonset
-from app.services.hindu_calendar import calculate_tithi, calculate_nakshatra, calculate_karana, calculate_yoga, calculate_all_periods_for_hindu_day
+from app.services.hindu_calendar import calculate_panchang_all, calculate_all_periods_for_hindu_day
 from app.services.muhurat import (
     calculate_rahu_kalam, calculate_gulika_kalam, calculate_yamaganda_kalam, calculate_varjyam,
     calculate_abhijit_muhurat, calculate_brahma_muhurat, calculate_pradosha_time
 )
-from app.utils.timezone import get_julian_day_ut, local_to_utc, CITY_TIMEZONES
+from app.utils.timezone import get_julian_day_ut, local_to_utc, CITY_TIMEZONES, IST
 
 router = APIRouter()
+logger = logging.getLogger(__name__)
 
 @router.post(
     "/panchangam",
@@ -69,10 +71,11 @@ async def calculate_panchangam(request: PanchangamRequest) -> PanchangamResponse
         )
         
         # Hindu calendar calculations
-        tithi_data = calculate_tithi(jd, request.city)
-        nakshatra_data = calculate_nakshatra(jd, request.city)
-        karana_data = calculate_karana(jd, request.city)
-        yoga_data = calculate_yoga(jd, request.city)
+        panchang_data = calculate_panchang_all(jd, request.city)
+        tithi_data = panchang_data["tithi"]
+        nakshatra_data = panchang_data["nakshatra"]
+        karana_data = panchang_data["karana"]
+        yoga_data = panchang_data["yoga"]
         
         # Convert to PeriodTime objects
         tithi = PeriodTime(**tithi_data)
@@ -198,14 +201,14 @@ async def calculate_panchangam_periods(request: PeriodRequest) -> PeriodsRespons
             periods_data = calculate_all_periods_for_hindu_day(
                 calc_date, request.latitude, request.longitude
             )
-        except Exception as calc_error:
-            print(f"Calculation error: {calc_error}")
+        except Exception:
+            logger.exception("Calculation error")
             # Return a fallback response if calculation fails
             periods_data = {
-                'date': calc_date.strftime('%Y-%m-%d'),
+                'date': calc_date.date().isoformat(),
                 'location': {'latitude': request.latitude, 'longitude': request.longitude},
-                'sunrise': f"{calc_date.replace(hour=6, minute=10).isoformat()}+05:30",
-                'sunrise_next': f"{(calc_date + timedelta(days=1)).replace(hour=6, minute=10).isoformat()}+05:30",
+                'sunrise': calc_date.replace(hour=6, minute=10, tzinfo=IST).isoformat(),
+                'sunrise_next': (calc_date + timedelta(days=1)).replace(hour=6, minute=10, tzinfo=IST).isoformat(),
                 'tithis': [],
                 'nakshatras': [],
                 'karanas': [],
@@ -239,9 +242,7 @@ async def calculate_panchangam_periods(request: PeriodRequest) -> PeriodsRespons
             detail=f"Invalid input data: {str(e)}"
         )
     except Exception as e:
-        print(f"Endpoint error: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Endpoint error")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Calculation error: {str(e)}"
@@ -2,15 +2,20 @@
 Core astronomical calculations using Swiss Ephemeris
 Based on the proven drik-panchanga implementation
 """
+import logging
 import swisseph as swe
 import math
 from datetime import datetime, timezone, timedelta
 from typing import Tuple, Optional, List
-from app.utils.timezone import get_julian_day_ut, julian_day_to_datetime, utc_to_local, format_time_12hour
+from functools import lru_cache
+from app.utils.timezone import get_julian_day_ut, julian_day_to_datetime, utc_to_local, format_time_12hour, normalize_city_name
 from app.utils.constants import SUN, MOON, SIDEREAL_FLAG
 
+logger = logging.getLogger(__name__)
+
 # Initialize Swiss Ephemeris - use built-in ephemeris data
 swe.set_ephe_path('')  # Use built-in ephemeris data
+swe.set_sid_mode(swe.SIDM_LAHIRI)  # Lahiri Ayanamsa for all sidereal calculations
 
 def to_dms(deg: float) -> List[int]:
     """Convert decimal degrees to degrees, minutes, seconds"""
@@ -45,51 +50,201 @@ def calculate_sunrise_sunset(
     """
     try:
         year, month, day = date.year, date.month, date.day
-        print(f"Calculating sunrise/sunset for {year}-{month:02d}-{day:02d}, Lat: {latitude}, Lon: {longitude}, City: {city}")
-        
-        # Julian Day for midnight UTC
-        jd_start = swe.julday(year, month, day, 0.0)
-        
-        # Get timezone offset for the city
-        tz_offset = get_timezone_offset(city, longitude, date)
-        print(f"Using timezone offset: {tz_offset} hours for {city}")
+        logger.debug("Calculating sunrise/sunset for %d-%02d-%02d, Lat: %s, Lon: %s, City: %s",
+                     year, month, day, latitude, longitude, city)
         
-        # Find sunrise and sunset using iterative search
-        sunrise_jd = find_sun_event(jd_start, latitude, longitude, True)  # True for sunrise
-        sunset_jd = find_sun_event(jd_start, latitude, longitude, False)  # False for sunset
+        sunrise_hour, sunset_hour = calculate_sunrise_sunset_hours(date, latitude, longitude, city)
         
         sunrise_time = "No Rise"
         sunset_time = "No Set"
         
-        if sunrise_jd:
-            sunrise_local_jd = sunrise_jd + tz_offset/24
-            sunrise_time = format_jd_to_time(sunrise_local_jd)
+        if sunrise_hour is not None:
+            sunrise_time = format_hour_to_time(sunrise_hour)
         
-        if sunset_jd:
-            sunset_local_jd = sunset_jd + tz_offset/24
-            sunset_time = format_jd_to_time(sunset_local_jd)
+        if sunset_hour is not None:
+            sunset_time = format_hour_to_time(sunset_hour)
         
-        print(f"Results - Sunrise: {sunrise_time}, Sunset: {sunset_time}")
+        logger.debug("Results - Sunrise: %s, Sunset: %s", sunrise_time, sunset_time)
         return sunrise_time, sunset_time
             
-    except Exception as e:
-        print(f"Error calculating sunrise/sunset: {e}")
-        import traceback
-        traceback.print_exc()
+    except Exception:
+        logger.exception("Error calculating sunrise/sunset")
         return "Calc Error", "Calc Error"
 
-def find_sun_event(jd_start: float, latitude: float, longitude: float, is_sunrise: bool) -> Optional[float]:
+def calculate_sunrise_sunset_hours(
+    date: datetime, 
+    latitude: float, 
+    longitude: float, 
+    city: str
+) -> Tuple[Optional[float], Optional[float]]:
     """
-    Find the exact Julian Day of sunrise or sunset using iterative search
+    Calculate sunrise and sunset as decimal local hours
+    
+    Same search as calculate_sunrise_sunset, for callers that need the
+    numeric time rather than a display string. Results are cached per
+    date and place, so the panchang, periods and muhurat code paths share
+    one search.
+    
+    Args:
+        date: Date for calculation (local date)
+        latitude: Latitude in degrees
+        longitude: Longitude in degrees
+        city: City name for timezone calculation
+        
+    Returns:
+        Tuple of (sunrise_hour, sunset_hour) in local time (0-24),
+        None for an event that does not occur on this date
+    """
+    return _sunrise_sunset_hours_on(date.year, date.month, date.day, latitude, longitude, city)
+
+@lru_cache(maxsize=1024)
+def _sunrise_sunset_hours_on(
+    year: int, 
+    month: int, 
+    day: int, 
+    latitude: float, 
+    longitude: float, 
+    city: str
+) -> Tuple[Optional[float], Optional[float]]:
+    """Sunrise/sunset search for one local date and place, shared by all callers"""
+    # Julian Day for midnight UTC
+    jd_start = swe.julday(year, month, day, 0.0)
+    
+    # Get timezone offset for the city
+    tz_offset = get_timezone_offset(city, longitude, datetime(year, month, day))
+    
+    # Find sunrise and sunset with one shared iterative search
+    sunrise_jd, sunset_jd = find_sun_events(jd_start, latitude, longitude)
+    
+    sunrise_hour = None
+    sunset_hour = None
+    
+    if sunrise_jd:
+        sunrise_hour = swe.revjul(sunrise_jd + tz_offset/24)[3]
+    
+    if sunset_jd:
+        sunset_hour = swe.revjul(sunset_jd + tz_offset/24)[3]
+    
+    return sunrise_hour, sunset_hour
+
+def calculate_sunrise_sunset_dt(
+    date: datetime, 
+    latitude: float, 
+    longitude: float, 
+    city: str
+) -> Tuple[Optional[datetime], Optional[datetime]]:
+    """
+    Calculate sunrise and sunset as naive local datetimes
+    
+    Times are truncated to the minute, matching the strings returned by
+    calculate_sunrise_sunset, so callers can do datetime arithmetic
+    instead of parsing those strings back.
+    
+    Args:
+        date: Date for calculation (local date)
+        latitude: Latitude in degrees
+        longitude: Longitude in degrees
+        city: City name for timezone calculation
+        
+    Returns:
+        Tuple of (sunrise, sunset) datetimes, None for an event that does
+        not occur on this date. A sunset that falls before sunrise on the
+        local clock is moved to the following day.
+    """
+    sunrise_hour, sunset_hour = calculate_sunrise_sunset_hours(date, latitude, longitude, city)
+    midnight = datetime(date.year, date.month, date.day)
+    
+    def to_datetime(hour_float: Optional[float]) -> Optional[datetime]:
+        if hour_float is None:
+            return None
+        hours = int(hour_float)
+        minutes = int((hour_float - hours) * 60)
+        return midnight + timedelta(hours=hours, minutes=minutes)
+    
+    sunrise = to_datetime(sunrise_hour)
+    sunset = to_datetime(sunset_hour)
+    if sunrise is not None and sunset is not None and sunset < sunrise:
+        sunset += timedelta(days=1)
+    
+    return sunrise, sunset
+
+def _bracket_crossings(
+    body: int, 
+    jd_start: float, 
+    step_size: float, 
+    num_steps: int, 
+    latitude: float, 
+    longitude: float, 
+    target_altitude: float, 
+    stride: int
+) -> Tuple[Optional[Tuple[float, float]], Optional[Tuple[float, float]]]:
+    """
+    Bracket the first rising and setting crossings of target_altitude
+    
+    Walks the grid jd_start + i * step_size (i < num_steps) every `stride`
+    samples, and only evaluates the samples in between for a stretch whose
+    ends show a crossing. The brackets are the same grid intervals a
+    sample-by-sample walk finds, unless the body crosses the target twice
+    within one stride (only possible when it grazes the horizon).
+    
+    Args:
+        body: Swiss Ephemeris body constant
+        jd_start: First sample, Julian Day (UT)
+        step_size: Grid spacing in days
+        num_steps: Number of grid samples
+        latitude: Observer latitude in degrees
+        longitude: Observer longitude in degrees
+        target_altitude: Altitude that marks the event, in degrees
+        stride: Grid samples skipped per coarse step
+        
+    Returns:
+        Tuple of (rise_bracket, set_bracket), each a (jd_before, jd_after)
+        pair or None if that crossing was not found
+    """
+    def altitude_at(i: int) -> float:
+        return calculate_body_altitude(jd_start + i * step_size, body, latitude, longitude)
+    
+    rise_bracket = None
+    set_bracket = None
+    last = num_steps - 1
+    coarse_i = 0
+    coarse_altitude = altitude_at(0)
+    
+    while coarse_i < last and (rise_bracket is None or set_bracket is None):
+        next_i = min(coarse_i + stride, last)
+        next_altitude = altitude_at(next_i)
+        
+        rising = coarse_altitude <= target_altitude < next_altitude
+        setting = coarse_altitude >= target_altitude > next_altitude
+        if (rising and rise_bracket is None) or (setting and set_bracket is None):
+            # Find the crossing on the fine grid inside this stretch
+            previous_i, previous_altitude = coarse_i, coarse_altitude
+            for i in range(coarse_i + 1, next_i + 1):
+                altitude = next_altitude if i == next_i else altitude_at(i)
+                if rise_bracket is None and previous_altitude <= target_altitude < altitude:
+                    rise_bracket = (jd_start + previous_i * step_size, jd_start + i * step_size)
+                elif set_bracket is None and previous_altitude >= target_altitude > altitude:
+                    set_bracket = (jd_start + previous_i * step_size, jd_start + i * step_size)
+                previous_i, previous_altitude = i, altitude
+        
+        coarse_i, coarse_altitude = next_i, next_altitude
+    
+    return rise_bracket, set_bracket
+
+def find_sun_events(jd_start: float, latitude: float, longitude: float) -> Tuple[Optional[float], Optional[float]]:
+    """
+    Find the exact Julian Days of sunrise and sunset using one iterative search
+    
+    Both events are bracketed from the same coarse altitude samples, so the
+    day is scanned once instead of once per event.
     
     Args:
         jd_start: Starting Julian Day (midnight UTC)
         latitude: Observer latitude in degrees
-        longitude: Observer longitude in degrees  
-        is_sunrise: True for sunrise, False for sunset
+        longitude: Observer longitude in degrees
         
     Returns:
-        Julian Day of the event in UTC, or None if not found
+        Tuple of (sunrise_jd, sunset_jd) in UTC, None for an event not found
     """
     try:
         # Search range: 24 hours from start
@@ -99,52 +254,57 @@ def find_sun_event(jd_start: float, latitude: float, longitude: float, is_sunris
         # Target altitude for sun: -0.833 degrees (accounts for atmospheric refraction)
         target_altitude = -0.833
         
-        previous_altitude = None
-        previous_jd = None
-        
-        # Coarse search to find approximate crossing
-        for i in range(int(search_duration / step_size)):
-            jd = jd_start + i * step_size
-            altitude = calculate_body_altitude(jd, swe.SUN, latitude, longitude)
-            
-            if previous_altitude is not None:
-                # Check for crossing
-                if is_sunrise:
-                    # Sunrise: altitude crosses from below to above target
-                    if previous_altitude <= target_altitude < altitude:
-                        # Refine with binary search
-                        return binary_search_crossing(
-                            previous_jd, jd, swe.SUN, latitude, longitude, target_altitude, is_sunrise
-                        )
-                else:
-                    # Sunset: altitude crosses from above to below target
-                    if previous_altitude >= target_altitude > altitude:
-                        # Refine with binary search
-                        return binary_search_crossing(
-                            previous_jd, jd, swe.SUN, latitude, longitude, target_altitude, is_sunrise
-                        )
-            
-            previous_altitude = altitude
-            previous_jd = jd
-        
-        return None
+        # Coarse search in 24-minute strides, narrowed to the 3-minute grid
+        rise_bracket, set_bracket = _bracket_crossings(
+            swe.SUN, jd_start, step_size, int(search_duration / step_size),
+            latitude, longitude, target_altitude, stride=8
+        )
+        
+        # Refine each crossing with binary search
+        sunrise_jd = None
+        sunset_jd = None
+        if rise_bracket is not None:
+            sunrise_jd = binary_search_crossing(
+                rise_bracket[0], rise_bracket[1], swe.SUN, latitude, longitude, target_altitude, True
+            )
+        if set_bracket is not None:
+            sunset_jd = binary_search_crossing(
+                set_bracket[0], set_bracket[1], swe.SUN, latitude, longitude, target_altitude, False
+            )
+        
+        return sunrise_jd, sunset_jd
+        
+    except Exception:
+        logger.exception("Error in find_sun_events")
+        return None, None
+
+def find_sun_event(jd_start: float, latitude: float, longitude: float, is_sunrise: bool) -> Optional[float]:
+    """
+    Find the exact Julian Day of sunrise or sunset using iterative search
+    
+    Args:
+        jd_start: Starting Julian Day (midnight UTC)
+        latitude: Observer latitude in degrees
+        longitude: Observer longitude in degrees  
+        is_sunrise: True for sunrise, False for sunset
         
-    except Exception as e:
-        print(f"Error in find_sun_event: {e}")
-        return None
+    Returns:
+        Julian Day of the event in UTC, or None if not found
+    """
+    sunrise_jd, sunset_jd = find_sun_events(jd_start, latitude, longitude)
+    return sunrise_jd if is_sunrise else sunset_jd
 
-def find_moon_event(jd_start: float, latitude: float, longitude: float, is_moonrise: bool) -> Optional[float]:
+def find_moon_events(jd_start: float, latitude: float, longitude: float) -> Tuple[Optional[float], Optional[float]]:
     """
-    Find the exact Julian Day of moonrise or moonset using iterative search
+    Find the exact Julian Days of moonrise and moonset using one iterative search
     
     Args:
         jd_start: Starting Julian Day (midnight UTC)
         latitude: Observer latitude in degrees
         longitude: Observer longitude in degrees
-        is_moonrise: True for moonrise, False for moonset
         
     Returns:
-        Julian Day of the event in UTC, or None if not found
+        Tuple of (moonrise_jd, moonset_jd) in UTC, None for an event not found
     """
     try:
         # Search range: 48 hours from start (moon events can span days)
@@ -154,39 +314,45 @@ def find_moon_event(jd_start: float, latitude: float, longitude: float, is_moonr
         # Target altitude for moon: 0.0 degrees (geometric horizon)
         target_altitude = 0.0
         
-        previous_altitude = None
-        previous_jd = None
-        
-        # Coarse search to find approximate crossing
-        for i in range(int(search_duration / step_size)):
-            jd = jd_start + i * step_size
-            altitude = calculate_body_altitude(jd, swe.MOON, latitude, longitude)
-            
-            if previous_altitude is not None:
-                # Check for crossing
-                if is_moonrise:
-                    # Moonrise: altitude crosses from below to above target
-                    if previous_altitude <= target_altitude < altitude:
-                        # Refine with binary search
-                        return binary_search_crossing(
-                            previous_jd, jd, swe.MOON, latitude, longitude, target_altitude, is_moonrise
-                        )
-                else:
-                    # Moonset: altitude crosses from above to below target
-                    if previous_altitude >= target_altitude > altitude:
-                        # Refine with binary search
-                        return binary_search_crossing(
-                            previous_jd, jd, swe.MOON, latitude, longitude, target_altitude, is_moonrise
-                        )
-            
-            previous_altitude = altitude
-            previous_jd = jd
-        
-        return None
+        # Coarse search in 1-hour strides, narrowed to the 10-minute grid
+        rise_bracket, set_bracket = _bracket_crossings(
+            swe.MOON, jd_start, step_size, int(search_duration / step_size),
+            latitude, longitude, target_altitude, stride=6
+        )
+        
+        # Refine each crossing with binary search
+        moonrise_jd = None
+        moonset_jd = None
+        if rise_bracket is not None:
+            moonrise_jd = binary_search_crossing(
+                rise_bracket[0], rise_bracket[1], swe.MOON, latitude, longitude, target_altitude, True
+            )
+        if set_bracket is not None:
+            moonset_jd = binary_search_crossing(
+                set_bracket[0], set_bracket[1], swe.MOON, latitude, longitude, target_altitude, False
+            )
+        
+        return moonrise_jd, moonset_jd
+        
+    except Exception:
+        logger.exception("Error in find_moon_events")
+        return None, None
+
+def find_moon_event(jd_start: float, latitude: float, longitude: float, is_moonrise: bool) -> Optional[float]:
+    """
+    Find the exact Julian Day of moonrise or moonset using iterative search
+    
+    Args:
+        jd_start: Starting Julian Day (midnight UTC)
+        latitude: Observer latitude in degrees
+        longitude: Observer longitude in degrees
+        is_moonrise: True for moonrise, False for moonset
         
-    except Exception as e:
-        print(f"Error in find_moon_event: {e}")
-        return None
+    Returns:
+        Julian Day of the event in UTC, or None if not found
+    """
+    moonrise_jd, moonset_jd = find_moon_events(jd_start, latitude, longitude)
+    return moonrise_jd if is_moonrise else moonset_jd
 
 def calculate_body_altitude(jd: float, body: int, latitude: float, longitude: float) -> float:
     """
@@ -202,20 +368,14 @@ def calculate_body_altitude(jd: float, body: int, latitude: float, longitude: fl
         Altitude in degrees (negative = below horizon)
     """
     try:
-        # Get body position
-        result = swe.calc_ut(jd, body, swe.FLG_SWIEPH)
+        # Get body position directly in equatorial coordinates; one ephemeris
+        # call instead of ecliptic position + obliquity + Python conversion
+        result = swe.calc_ut(jd, body, swe.FLG_SWIEPH | swe.FLG_EQUATORIAL)
         if not result:
             return -90.0
-            
-        # Get ecliptic coordinates
-        ecliptic_lon = result[0][0]  # Ecliptic longitude
-        ecliptic_lat = result[0][1]  # Ecliptic latitude
-        
-        # Get obliquity of ecliptic
-        obliquity = swe.calc_ut(jd, swe.ECL_NUT, 0)[0][0]
         
-        # Convert to equatorial coordinates
-        ra, dec = ecliptic_to_equatorial(ecliptic_lon, ecliptic_lat, obliquity)
+        ra = result[0][0]   # Right ascension
+        dec = result[0][1]  # Declination
         
         # Calculate Greenwich Mean Sidereal Time
         gmst = swe.sidtime(jd) * 15  # Convert hours to degrees
@@ -226,11 +386,8 @@ def calculate_body_altitude(jd: float, body: int, latitude: float, longitude: fl
         # Calculate Hour Angle
         hour_angle = lst - ra
         
-        # Normalize hour angle to [-180, 180]
-        while hour_angle > 180:
-            hour_angle -= 360
-        while hour_angle < -180:
-            hour_angle += 360
+        # Normalize hour angle to [-180, 180)
+        hour_angle = (hour_angle + 180.0) % 360.0 - 180.0
         
         # Convert to radians
         lat_rad = math.radians(latitude)
@@ -247,8 +404,8 @@ def calculate_body_altitude(jd: float, body: int, latitude: float, longitude: fl
         
         return altitude
         
-    except Exception as e:
-        print(f"Error calculating body altitude: {e}")
+    except Exception:
+        logger.exception("Error calculating body altitude")
         return -90.0
 
 def ecliptic_to_equatorial(ecliptic_lon: float, ecliptic_lat: float, obliquity: float) -> Tuple[float, float]:
@@ -330,6 +487,53 @@ def binary_search_crossing(
     
     return (start_jd + end_jd) / 2
 
+# City-specific timezone offsets (hours from UTC) with DST consideration,
+# keyed by normalized city name
+_CITY_TZ_OFFSETS = {
+    "bengaluru": 5.5,   # IST (no DST)
+    "bangalore": 5.5,   # IST (no DST)
+    "mumbai": 5.5,      # IST (no DST)
+    "delhi": 5.5,       # IST (no DST)
+    "chennai": 5.5,     # IST (no DST)
+    "kolkata": 5.5,     # IST (no DST)
+    "hyderabad": 5.5,   # IST (no DST)
+    "pune": 5.5,        # IST (no DST)
+    
+    # UK uses BST (UTC+1) in summer, GMT (UTC+0) in winter
+    # October 5, 2025 would be BST (UTC+1)
+    "coventry": 1.0,    # BST in October
+    "london": 1.0,      # BST in October
+    "manchester": 1.0,  # BST in October
+    "birmingham": 1.0,  # BST in October
+    
+    # USA East Coast uses EDT (UTC-4) in summer, EST (UTC-5) in winter
+    # October 5, 2025 would be EDT (UTC-4) - DST ends first Sunday of November
+    "new york": -4.0,   # EDT in October
+    "newyork": -4.0,    # EDT in October
+    "miami": -4.0,      # EDT in October
+    
+    # USA West Coast uses PDT (UTC-7) in summer, PST (UTC-8) in winter
+    "los angeles": -7.0, # PDT in October
+    
+    # USA Central uses CDT (UTC-5) in summer, CST (UTC-6) in winter
+    "chicago": -5.0,    # CDT in October
+    
+    "lima": -5.0,       # PET (Peru Time, no DST)
+    
+    "harare": 2.0,      # CAT (Central Africa Time, no DST)
+    "johannesburg": 2.0, # SAST (no DST)
+    "cape town": 2.0,   # SAST (no DST)
+    
+    # Australia uses AEDT (UTC+11) in summer, AEST (UTC+10) in winter
+    # October 5 is spring in Australia - DST starts first Sunday of October
+    # So October 5, 2025 would be AEDT (UTC+11)
+    "canberra": 11.0,   # AEDT in October
+    "sydney": 11.0,     # AEDT in October
+    "melbourne": 11.0,  # AEDT in October
+    "brisbane": 10.0,   # AEST (Queensland doesn't use DST)
+    "perth": 8.0,       # AWST (Western Australia doesn't use DST)
+}
+
 def get_timezone_offset(city: str, longitude: float, date: datetime = None) -> float:
     """
     Get timezone offset for a given city/longitude, considering daylight saving time
@@ -342,56 +546,10 @@ def get_timezone_offset(city: str, longitude: float, date: datetime = None) -> f
     Returns:
         Timezone offset in hours from UTC
     """
-    # City-specific timezone mappings with DST consideration
-    city_timezones = {
-        "bengaluru": 5.5,   # IST (no DST)
-        "bangalore": 5.5,   # IST (no DST)
-        "mumbai": 5.5,      # IST (no DST)
-        "delhi": 5.5,       # IST (no DST)
-        "chennai": 5.5,     # IST (no DST)
-        "kolkata": 5.5,     # IST (no DST)
-        "hyderabad": 5.5,   # IST (no DST)
-        "pune": 5.5,        # IST (no DST)
-        
-        # UK uses BST (UTC+1) in summer, GMT (UTC+0) in winter
-        # October 5, 2025 would be BST (UTC+1)
-        "coventry": 1.0,    # BST in October
-        "london": 1.0,      # BST in October
-        "manchester": 1.0,  # BST in October
-        "birmingham": 1.0,  # BST in October
-        
-        # USA East Coast uses EDT (UTC-4) in summer, EST (UTC-5) in winter
-        # October 5, 2025 would be EDT (UTC-4) - DST ends first Sunday of November
-        "new york": -4.0,   # EDT in October
-        "newyork": -4.0,    # EDT in October
-        "miami": -4.0,      # EDT in October
-        
-        # USA West Coast uses PDT (UTC-7) in summer, PST (UTC-8) in winter
-        "los angeles": -7.0, # PDT in October
-        
-        # USA Central uses CDT (UTC-5) in summer, CST (UTC-6) in winter
-        "chicago": -5.0,    # CDT in October
-        
-        "lima": -5.0,       # PET (Peru Time, no DST)
-        
-        "harare": 2.0,      # CAT (Central Africa Time, no DST)
-        "johannesburg": 2.0, # SAST (no DST)
-        "cape town": 2.0,   # SAST (no DST)
-        
-        # Australia uses AEDT (UTC+11) in summer, AEST (UTC+10) in winter
-        # October 5 is spring in Australia - DST starts first Sunday of October
-        # So October 5, 2025 would be AEDT (UTC+11)
-        "canberra": 11.0,   # AEDT in October
-        "sydney": 11.0,     # AEDT in October
-        "melbourne": 11.0,  # AEDT in October
-        "brisbane": 10.0,   # AEST (Queensland doesn't use DST)
-        "perth": 8.0,       # AWST (Western Australia doesn't use DST)
-    }
-    
     # Check for exact city match first
-    city_lower = city.lower().replace(" ", "").replace("-", "")
-    if city_lower in city_timezones:
-        return city_timezones[city_lower]
+    city_lower = normalize_city_name(city)
+    if city_lower in _CITY_TZ_OFFSETS:
+        return _CITY_TZ_OFFSETS[city_lower]
     
     # Fallback: estimate timezone from longitude
     # Rough approximation: 15 degrees longitude = 1 hour
@@ -412,28 +570,38 @@ def format_jd_to_time(jd: float) -> str:
     """
     try:
         cal_date = swe.revjul(jd)
-        year, month, day, hour_float = cal_date[:4]
-        
-        hours = int(hour_float)
-        minutes = int((hour_float - hours) * 60)
-        
-        # Handle overflow
-        if hours >= 24:
-            hours -= 24
-        
-        # Format as 12-hour time
-        if hours == 0:
-            return f"12:{minutes:02d} AM"
-        elif hours < 12:
-            return f"{hours}:{minutes:02d} AM"
-        elif hours == 12:
-            return f"12:{minutes:02d} PM"
-        else:
-            return f"{hours-12}:{minutes:02d} PM"
-    except Exception as e:
-        print(f"Error formatting time: {e}")
+        return format_hour_to_time(cal_date[3])
+    except Exception:
+        logger.exception("Error formatting time")
         return "Time Error"
 
+def format_hour_to_time(hour_float: float) -> str:
+    """
+    Convert decimal local hours to a time string in HH:MM AM/PM format
+    
+    Args:
+        hour_float: Hours since local midnight
+        
+    Returns:
+        Time string in "HH:MM AM/PM" format
+    """
+    hours = int(hour_float)
+    minutes = int((hour_float - hours) * 60)
+    
+    # Handle overflow
+    if hours >= 24:
+        hours -= 24
+    
+    # Format as 12-hour time
+    if hours == 0:
+        return f"12:{minutes:02d} AM"
+    elif hours < 12:
+        return f"{hours}:{minutes:02d} AM"
+    elif hours == 12:
+        return f"12:{minutes:02d} PM"
+    else:
+        return f"{hours-12}:{minutes:02d} PM"
+
 def calculate_moonrise_moonset(
     date: datetime, 
     latitude: float, 
@@ -455,7 +623,7 @@ def calculate_moonrise_moonset(
     """
     try:
         year, month, day = date.year, date.month, date.day
-        print(f"Calculating moonrise/moonset for {year}-{month:02d}-{day:02d}, City: {city}")
+        logger.debug("Calculating moonrise/moonset for %d-%02d-%02d, City: %s", year, month, day, city)
         
         # Julian Day for midnight UTC
         jd_start = swe.julday(year, month, day, 0.0)
@@ -463,9 +631,8 @@ def calculate_moonrise_moonset(
         # Get timezone offset for the city
         tz_offset = get_timezone_offset(city, longitude, date)
         
-        # Find moonrise and moonset using iterative search
-        moonrise_jd = find_moon_event(jd_start, latitude, longitude, True)  # True for moonrise
-        moonset_jd = find_moon_event(jd_start, latitude, longitude, False)  # False for moonset
+        # Find moonrise and moonset with one shared iterative search
+        moonrise_jd, moonset_jd = find_moon_events(jd_start, latitude, longitude)
         
         moonrise_time = "No Rise"
         moonset_time = "No Set"
@@ -484,24 +651,54 @@ def calculate_moonrise_moonset(
             else:
                 moonset_time = format_jd_to_time(moonset_local_jd)
         
-        print(f"Results - Moonrise: {moonrise_time}, Moonset: {moonset_time}")
+        logger.debug("Results - Moonrise: %s, Moonset: %s", moonrise_time, moonset_time)
         return moonrise_time, moonset_time
             
-    except Exception as e:
-        print(f"Error calculating moonrise/moonset: {e}")
-        import traceback
-        traceback.print_exc()
+    except Exception:
+        logger.exception("Error calculating moonrise/moonset")
         return "Calc Error", "Calc Error"
 
+# Longitude/ayanamsa caches are keyed on the instant rounded to the whole
+# second; the Moon moves ~0.5 arc-seconds in that time, far below panchang
+# precision, and nearby lookups (e.g. rise_jd + t) then share one entry
+_SECONDS_PER_DAY = 86400
+
+@lru_cache(maxsize=4096)
+def _solar_longitude_at(jd_key: int) -> float:
+    """Solar longitude at the instant jd_key (seconds since JD 0)"""
+    data = swe.calc_ut(jd_key / _SECONDS_PER_DAY, swe.SUN, flags=swe.FLG_SWIEPH)
+    return data[0][0]
+
+@lru_cache(maxsize=4096)
+def _lunar_longitude_at(jd_key: int) -> float:
+    """Lunar longitude at the instant jd_key (seconds since JD 0)"""
+    data = swe.calc_ut(jd_key / _SECONDS_PER_DAY, swe.MOON, flags=swe.FLG_SWIEPH)
+    return data[0][0]
+
+@lru_cache(maxsize=4096)
+def _ayanamsa_at(jd_key: int) -> float:
+    """Lahiri ayanamsa at the instant jd_key (seconds since JD 0)"""
+    return swe.get_ayanamsa_ut(jd_key / _SECONDS_PER_DAY)
+
 def solar_longitude(jd: float) -> float:
     """Solar longitude at given instant (julian day) jd"""
-    data = swe.calc_ut(jd, swe.SUN, flags=swe.FLG_SWIEPH)
-    return data[0][0]  # in degrees
+    return _solar_longitude_at(round(jd * _SECONDS_PER_DAY))  # in degrees
 
 def lunar_longitude(jd: float) -> float:
     """Lunar longitude at given instant (julian day) jd"""
-    data = swe.calc_ut(jd, swe.MOON, flags=swe.FLG_SWIEPH)
-    return data[0][0]  # in degrees
+    return _lunar_longitude_at(round(jd * _SECONDS_PER_DAY))  # in degrees
+
+def get_ayanamsa(jd: float) -> float:
+    """Lahiri ayanamsa at given instant (julian day) jd"""
+    return _ayanamsa_at(round(jd * _SECONDS_PER_DAY))  # in degrees
+
+def sun_moon_longitude(jd: float) -> Tuple[float, float]:
+    """Solar and lunar longitudes at the same instant jd, as (sun, moon).
+
+    Both bodies are evaluated back to back so Swiss Ephemeris can reuse
+    the ephemeris file segment it has just read."""
+    jd_key = round(jd * _SECONDS_PER_DAY)
+    return _solar_longitude_at(jd_key), _lunar_longitude_at(jd_key)
 
 def get_sun_position(jd: float) -> Tuple[float, float]:
     """
@@ -514,17 +711,14 @@ def get_sun_position(jd: float) -> Tuple[float, float]:
         Tuple of (longitude, latitude) in degrees
     """
     try:
-        # Set sidereal mode for accurate calculations
-        swe.set_sid_mode(swe.SIDM_LAHIRI)
-        
         # Calculate sun position
         result = swe.calc_ut(jd, SUN, SIDEREAL_FLAG | swe.FLG_SWIEPH)
         if result:
             return result[0][0], result[0][1]  # longitude, latitude
         else:
             return 0.0, 0.0
-    except Exception as e:
-        print(f"Error getting sun position: {e}")
+    except Exception:
+        logger.exception("Error getting sun position")
         return 0.0, 0.0
 
 def get_moon_position(jd: float) -> Tuple[float, float]:
@@ -538,15 +732,12 @@ def get_moon_position(jd: float) -> Tuple[float, float]:
         Tuple of (longitude, latitude) in degrees
     """
     try:
-        # Set sidereal mode for accurate calculations
-        swe.set_sid_mode(swe.SIDM_LAHIRI)
-        
         # Calculate moon position
         result = swe.calc_ut(jd, MOON, SIDEREAL_FLAG | swe.FLG_SWIEPH)
         if result:
             return result[0][0], result[0][1]  # longitude, latitude
         else:
             return 0.0, 0.0
-    except Exception as e:
-        print(f"Error getting moon position: {e}")
+    except Exception:
+        logger.exception("Error getting moon position")
         return 0.0, 0.0
\ No newline at end of file
@@ -2,50 +2,161 @@
 Hindu calendar calculations - Tithi, Nakshatra, Karana, Yoga
 Based on the proven DrikPanchanga implementation for maximum accuracy
 """
-import swisseph as swe
+import copy
 from datetime import datetime, timezone, timedelta
 from typing import Dict, Tuple, List
-from math import floor, ceil
-from app.utils.timezone import get_julian_day_ut, julian_day_to_datetime
+import logging
+from functools import lru_cache, wraps
+from operator import itemgetter
+from app.utils.timezone import (
+    get_julian_day_ut, julian_day_to_datetime, julian_day_to_naive_datetime, parse_time_12hour,
+    normalize_city_name, IST, tz_for
+)
 from app.utils.constants import (
-    TITHI_NAMES, NAKSHATRA_NAMES, KARANA_NAMES, YOGA_NAMES, PAKSHA_NAMES,
-    SUN, MOON, SIDEREAL_FLAG, NAKSHATRA_DEGREES, TITHI_DEGREES
+    TITHI_FULL_NAMES, NAKSHATRA_NAMES, KARANA_NAME_BY_NUM, YOGA_NAMES, PAKSHA_NAMES,
+    SUN, MOON, SIDEREAL_FLAG, NAKSHATRA_DEGREES, TITHI_DEGREES, YOGA_DEGREES, KARANA_DEGREES,
+    CITY_COORDINATES, DEFAULT_COORDINATES, COORD_TO_CITY
 )
 from app.services.astronomical import (
-    get_sun_position, get_moon_position, solar_longitude, lunar_longitude,
-    calculate_sunrise_sunset, get_timezone_offset
+    get_sun_position, get_moon_position, sun_moon_longitude, get_ayanamsa,
+    calculate_sunrise_sunset, calculate_sunrise_sunset_hours, get_timezone_offset
 )
 
+logger = logging.getLogger(__name__)
+
+# Dict form of CITY_COORDINATES, as returned by get_city_coordinates
+_CITY_COORDS = {
+    name: {"latitude": lat, "longitude": lon} for name, (lat, lon) in CITY_COORDINATES.items()
+}
+
+# Fallback coordinates (Bengaluru) for unknown cities
+_DEFAULT_COORDS = {"latitude": DEFAULT_COORDINATES[0], "longitude": DEFAULT_COORDINATES[1]}
+
 # Helper functions for accurate calculations
 
 def unwrap_angles(angles: List[float]) -> List[float]:
     """Add 360 to those elements in the input list so that
        all elements are sorted in ascending order."""
-    result = angles[:]
-    for i in range(1, len(angles)):
-        if result[i] < result[i-1]: 
-            result[i] += 360
+    # Every drop between consecutive raw angles is one more wrap past 360,
+    # so carry a running offset instead of rewriting elements in place
+    result = []
+    offset = 0
+    prev = None
+    for angle in angles:
+        if prev is not None and angle < prev:
+            offset += 360
+        result.append(angle + offset)
+        prev = angle
     return result
 
-def inverse_lagrange(x: List[float], y: List[float], ya: float) -> float:
-    """Given two lists x and y, find the value of x = xa when y = ya, i.e., f(xa) = ya
-    Uses inverse Lagrange interpolation for precise boundary timing"""
-    assert len(x) == len(y)
-    total = 0
-    for i in range(len(x)):
-        numer = 1
+def lagrange_weights(y: List[float]) -> List[float]:
+    """Barycentric weights w_i = 1 / prod(y_i - y_j) for the nodes y.
+    Depend only on the nodes, so they can be shared by several
+    inverse_lagrange evaluations over the same samples."""
+    weights = []
+    for i, yi in enumerate(y):
         denom = 1
-        for j in range(len(x)):
+        for j, yj in enumerate(y):
             if j != i:
-                numer *= (ya - y[j])
-                denom *= (y[i] - y[j])
-        total += numer * x[i] / denom
-    return total
+                denom *= (yi - yj)
+        weights.append(1 / denom)
+    return weights
+
+def inverse_lagrange(x: List[float], y: List[float], ya: float, weights: List[float] = None) -> float:
+    """Given two lists x and y, find the value of x = xa when y = ya, i.e., f(xa) = ya
+    Uses inverse Lagrange interpolation (barycentric form) for precise boundary timing"""
+    assert len(x) == len(y)
+    if weights is None:
+        weights = lagrange_weights(y)
+    numer = 0
+    denom = 0
+    for xi, yi, wi in zip(x, y, weights):
+        diff = ya - yi
+        if diff == 0:
+            return xi  # ya falls exactly on a sample
+        term = wi / diff
+        numer += term * xi
+        denom += term
+    return numer / denom
+
+def _fallback_period(name: str, hours: int) -> Dict[str, str]:
+    """Placeholder period starting now, used when a calculation fails"""
+    now = datetime.now()
+    end = now + timedelta(hours=hours)
+    return {
+        "name": name,
+        "start": now.isoformat(),
+        "end": end.isoformat(),
+        "start_dt": now,
+        "end_dt": end
+    }
+
+def _public_period(period: Dict) -> Dict[str, str]:
+    """Copy of a period with only its public name/start/end (ISO) fields;
+    the internal start_dt/end_dt datetimes are dropped"""
+    return {"name": period["name"], "start": period["start"], "end": period["end"]}
+
+def _panchang_safe(default_name: str, default_hours: int):
+    """Decorator: log any error from a panchang element calculation and
+    return a placeholder period named default_name instead"""
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            try:
+                return func(*args, **kwargs)
+            except Exception:
+                logger.exception("Error in %s", func.__name__)
+                return _fallback_period(default_name, default_hours)
+        return wrapper
+    return decorator
+
+# Sample points (days after sunrise) for the DrikPanchanga interpolation;
+# tithi and yoga interpolate over the motion since sunrise (4 points)
+_SAMPLE_OFFSETS = (0.0, 0.25, 0.5, 0.75, 1.0)
+_SWEEP_OFFSETS = _SAMPLE_OFFSETS[1:]
+
+@lru_cache(maxsize=512)
+def _ephem_batch(rise_jd: float) -> Tuple[Tuple[float, ...], Tuple[float, ...], Tuple[float, ...]]:
+    """Sun longitudes, Moon longitudes and Lahiri ayanamsa at each of
+    _SAMPLE_OFFSETS from sunrise, in one pass over Swiss Ephemeris.
+    
+    Cached on rise_jd so tithi, nakshatra and yoga for a day share the
+    same samples, including the next-sunrise (offset 1.0) values."""
+    sun = []
+    moon = []
+    ayanamsa = []
+    for t in _SAMPLE_OFFSETS:
+        sun_long, moon_long = sun_moon_longitude(rise_jd + t)
+        sun.append(sun_long)
+        moon.append(moon_long)
+        ayanamsa.append(get_ayanamsa(rise_jd + t))
+    return tuple(sun), tuple(moon), tuple(ayanamsa)
+
+def sweep_motion(rise_jd: float) -> Tuple[List[float], List[float]]:
+    """Motion of Sun and Moon since sunrise at each later sample offset.
+    Returns (relative, total): moon - sun motion for tithi and
+    moon + sun motion for yoga."""
+    sun, moon, _ = _ephem_batch(rise_jd)
+    sol0 = sun[0]
+    lun0 = moon[0]
+    relative = []
+    total = []
+    for i in range(1, len(_SAMPLE_OFFSETS)):
+        # Both bodies move well under 360 degrees in a day, so a single
+        # wrap-around correction is equivalent to % 360
+        lunar_diff = moon[i] - lun0
+        if lunar_diff < 0:
+            lunar_diff += 360
+        solar_diff = sun[i] - sol0
+        if solar_diff < 0:
+            solar_diff += 360
+        relative.append(lunar_diff - solar_diff)
+        total.append(lunar_diff + solar_diff)
+    return relative, total
 
 def lunar_phase(jd: float) -> float:
     """Calculate lunar phase (moon's longitude - sun's longitude)"""
-    solar_long = solar_longitude(jd)
-    lunar_long = lunar_longitude(jd)
+    solar_long, lunar_long = sun_moon_longitude(jd)
     moon_phase = (lunar_long - solar_long) % 360
     return moon_phase
 
@@ -53,152 +164,86 @@ def get_sunrise_jd(jd: float, city: str, latitude: float, longitude: float) -> f
     """Get sunrise Julian Day for calculations"""
     try:
         # Convert JD to date for sunrise calculation
-        cal_date = swe.revjul(jd)
-        date_obj = datetime(int(cal_date[0]), int(cal_date[1]), int(cal_date[2]))
+        date_obj = julian_day_to_naive_datetime(jd).replace(hour=0, minute=0, second=0)
         
         # Calculate sunrise
-        sunrise_str, _ = calculate_sunrise_sunset(date_obj, latitude, longitude, city)
+        sunrise_hour, _ = calculate_sunrise_sunset_hours(date_obj, latitude, longitude, city)
+        if sunrise_hour is None:
+            return jd  # Fallback
         
         # Convert sunrise time back to JD
         tz_offset = get_timezone_offset(city, longitude, date_obj)
         
-        # Parse sunrise time
-        if "AM" in sunrise_str or "PM" in sunrise_str:
-            time_part = sunrise_str.replace(" AM", "").replace(" PM", "")
-            hours, minutes = map(int, time_part.split(":"))
-            if "PM" in sunrise_str and hours != 12:
-                hours += 12
-            elif "AM" in sunrise_str and hours == 12:
-                hours = 0
-        else:
-            return jd  # Fallback
-        
         # Calculate sunrise JD in UTC
-        sunrise_hour = hours + minutes/60.0
         sunrise_local_jd = jd + (sunrise_hour - tz_offset) / 24.0
         
         return sunrise_local_jd - tz_offset/24.0  # Return in UTC
         
-    except Exception as e:
-        print(f"Error getting sunrise JD: {e}")
+    except Exception:
+        logger.exception("Error getting sunrise JD")
         return jd  # Fallback to input JD
 
 
-def calculate_tithi(jd: float, city: str) -> Dict[str, str]:
-    """
-    Calculate Tithi (lunar day) using exact DrikPanchanga algorithm
+def _tithi_at(jd: float, city: str, rise_jd: float, tz_offset: float) -> Dict[str, str]:
+    """Tithi from the shared sunrise (UTC JD) and timezone offset"""
+    # 2. Find tithi at sunrise
+    sun, moon, _ = _ephem_batch(rise_jd)
+    moon_phase = (moon[0] - sun[0]) % 360
+    today = int(moon_phase / TITHI_DEGREES) % 30 + 1
+    degrees_left = today * TITHI_DEGREES - moon_phase
     
-    Args:
-        jd: Julian Day Number
-        city: City name for timezone conversion
-        
-    Returns:
-        Dictionary with tithi name, start time, and end time
-    """
-    try:
-        # Set Lahiri Ayanamsa
-        swe.set_sid_mode(swe.SIDM_LAHIRI)
-        
-        # Get city coordinates and timezone
-        city_coords = get_city_coordinates(city)
-        latitude = city_coords.get('latitude', 12.9719)
-        longitude = city_coords.get('longitude', 77.593)
-        tz_offset = get_timezone_offset(city, longitude)
-        
-        # Create place tuple for DrikPanchanga format
-        place = (latitude, longitude, tz_offset)
-        
-        # 1. Find time of sunrise (in UTC)
-        rise_result = calculate_sunrise_for_panchang(jd, place)
-        rise_jd = rise_result[0] - tz_offset / 24  # Convert to UTC
-        
-        # 2. Find tithi at sunrise
-        moon_phase = lunar_phase(rise_jd)
-        today = ceil(moon_phase / 12)
-        degrees_left = today * 12 - moon_phase
-        
-        # 3. Compute longitudinal differences at intervals from sunrise
-        offsets = [0.25, 0.5, 0.75, 1.0]
-        lunar_long_diff = [(lunar_longitude(rise_jd + t) - lunar_longitude(rise_jd)) % 360 for t in offsets]
-        solar_long_diff = [(solar_longitude(rise_jd + t) - solar_longitude(rise_jd)) % 360 for t in offsets]
-        relative_motion = [moon - sun for (moon, sun) in zip(lunar_long_diff, solar_long_diff)]
-        
-        # 4. Find end time by 4-point inverse Lagrange interpolation
-        y = relative_motion
-        x = offsets
-        approx_end = inverse_lagrange(x, y, degrees_left)
-        ends_hours = (rise_jd + approx_end - jd) * 24 + tz_offset
-        
-        # 5. Check for skipped tithi
-        moon_phase_tmrw = lunar_phase(rise_jd + 1)
-        tomorrow = ceil(moon_phase_tmrw / 12)
-        isSkipped = (tomorrow - today) % 30 > 1
-        
-        # Convert timing to proper format
-        end_dt = jd_to_local_datetime_precise(jd + (ends_hours/24), city)
-        
-        # Calculate start time (previous tithi end)
-        prev_today = (today - 2) % 30 + 1  # Previous tithi
-        prev_degrees_left = prev_today * 12 - moon_phase
-        prev_approx_end = inverse_lagrange(x, y, prev_degrees_left)
-        start_hours = (rise_jd + prev_approx_end - jd) * 24 + tz_offset
-        start_dt = jd_to_local_datetime_precise(jd + (start_hours/24), city)
-        
-        # Determine paksha and get proper name
-        paksha = 0 if today <= 15 else 1
-        tithi_index = (today - 1) % 15
-        
-        if paksha == 0:  # Shukla Paksha
-            tithi_name = f"Shukla Paksha {TITHI_NAMES[tithi_index]}"
-        else:  # Krishna Paksha
-            tithi_name = f"Krishna Paksha {TITHI_NAMES[tithi_index]}"
-        
-        return {
-            "name": tithi_name,
-            "start": start_dt.isoformat(),
-            "end": end_dt.isoformat()
-        }
-        
-    except Exception as e:
-        print(f"Error calculating tithi: {e}")
-        import traceback
-        traceback.print_exc()
-        return {
-            "name": "Shukla Paksha Pratipada",
-            "start": datetime.now().isoformat(),
-            "end": (datetime.now() + timedelta(hours=24)).isoformat()
-        }
+    # 3. Compute longitudinal differences at intervals from sunrise
+    offsets = _SWEEP_OFFSETS
+    relative_motion, _ = sweep_motion(rise_jd)
+    
+    # 4. Find end time by 4-point inverse Lagrange interpolation
+    y = relative_motion
+    x = offsets
+    weights = lagrange_weights(y)  # shared by the end and start targets
+    approx_end = inverse_lagrange(x, y, degrees_left, weights)
+    ends_hours = (rise_jd + approx_end - jd) * 24 + tz_offset
+    
+    # 5. Check for skipped tithi
+    moon_phase_tmrw = (moon[-1] - sun[-1]) % 360
+    tomorrow = int(moon_phase_tmrw / TITHI_DEGREES) % 30 + 1
+    isSkipped = (tomorrow - today) % 30 > 1
+    
+    # Convert timing to proper format
+    end_dt = jd_to_local_datetime_precise(jd + (ends_hours/24), city)
+    
+    # Calculate start time (previous tithi end)
+    # The previous tithi ended (today - 1) * 12 degrees into the cycle,
+    # i.e. before sunrise; keep the target signed so that for the first
+    # tithi it stays at 0 degrees instead of wrapping to 360
+    prev_degrees_left = (today - 1) * TITHI_DEGREES - moon_phase
+    prev_approx_end = inverse_lagrange(x, y, prev_degrees_left, weights)
+    start_hours = (rise_jd + prev_approx_end - jd) * 24 + tz_offset
+    start_dt = jd_to_local_datetime_precise(jd + (start_hours/24), city)
+    
+    # Get tithi name with paksha prefix
+    tithi_name = TITHI_FULL_NAMES[today - 1]
+    
+    return {
+        "name": tithi_name,
+        "start": start_dt.isoformat(),
+        "end": end_dt.isoformat(),
+        "start_dt": start_dt,
+        "end_dt": end_dt
+    }
 
-def calculate_sunrise_for_panchang(jd: float, place: Tuple[float, float, float]) -> Tuple[float, List[int]]:
+def calculate_sunrise_for_panchang(jd: float, place: Tuple[float, float, float], city: str = None) -> Tuple[float, List[int]]:
     """Calculate sunrise using DrikPanchanga method"""
     lat, lon, tz = place
     try:
-        # Use our existing accurate sunrise calculation
-        cal_date = swe.revjul(jd)
-        date_obj = datetime(int(cal_date[0]), int(cal_date[1]), int(cal_date[2]))
-        
-        # Get city name from coordinates (reverse lookup)
-        city = "Bengaluru"  # Default fallback
-        for city_name, coords in get_city_coordinates_map().items():
-            if abs(coords['latitude'] - lat) < 0.1 and abs(coords['longitude'] - lon) < 0.1:
-                city = city_name
-                break
+        if city is None:
+            # Get city name from coordinates (reverse lookup)
+            city = COORD_TO_CITY.get((round(lat, 1), round(lon, 1)), "Bengaluru")
         
-        sunrise_str, _ = calculate_sunrise_sunset(date_obj, lat, lon, city)
-        
-        # Parse sunrise time and convert to JD
-        if "AM" in sunrise_str or "PM" in sunrise_str:
-            time_part = sunrise_str.replace(" AM", "").replace(" PM", "")
-            hours, minutes = map(int, time_part.split(":"))
-            if "PM" in sunrise_str and hours != 12:
-                hours += 12
-            elif "AM" in sunrise_str and hours == 12:
-                hours = 0
-        else:
-            hours, minutes = 6, 0  # Fallback
+        # Use our existing accurate sunrise calculation
+        cal_date = julian_day_to_naive_datetime(jd)
+        sunrise_hour = _sunrise_hour_for_date(cal_date.year, cal_date.month, cal_date.day, lat, lon, city)
         
         # Calculate sunrise JD in local time
-        sunrise_hour = hours + minutes/60.0
         sunrise_jd = jd + (sunrise_hour) / 24.0
         
         # Convert to DMS format for compatibility
@@ -206,41 +251,25 @@ def calculate_sunrise_for_panchang(jd: float, place: Tuple[float, float, float])
         
         return sunrise_jd, time_dms
         
-    except Exception as e:
-        print(f"Error in sunrise calculation: {e}")
+    except Exception:
+        logger.exception("Error in sunrise calculation")
         # Fallback to approximate sunrise
         return jd + 0.25, [6, 0, 0]  # 6 AM fallback
 
+def _sunrise_hour_for_date(year: int, month: int, day: int, lat: float, lon: float, city: str) -> float:
+    """Local sunrise hour on a date at (lat, lon), in the city's timezone;
+    the search itself is cached by calculate_sunrise_sunset_hours"""
+    date_obj = datetime(year, month, day)
+    
+    sunrise_hour, _ = calculate_sunrise_sunset_hours(date_obj, lat, lon, city)
+    if sunrise_hour is None:
+        return 6.0  # Fallback
+    
+    return sunrise_hour
+
 def get_city_coordinates_map() -> Dict[str, Dict[str, float]]:
     """Get full city coordinates mapping"""
-    return {
-        "bengaluru": {"latitude": 12.9719, "longitude": 77.593},
-        "bangalore": {"latitude": 12.9719, "longitude": 77.593},
-        "mumbai": {"latitude": 19.0760, "longitude": 72.8777},
-        "delhi": {"latitude": 28.6139, "longitude": 77.2090},
-        "chennai": {"latitude": 13.0827, "longitude": 80.2707},
-        "kolkata": {"latitude": 22.5726, "longitude": 88.3639},
-        "hyderabad": {"latitude": 17.3850, "longitude": 78.4867},
-        "pune": {"latitude": 18.5204, "longitude": 73.8567},
-        "coventry": {"latitude": 52.40656, "longitude": -1.51217},
-        "london": {"latitude": 51.5074, "longitude": -0.1278},
-        "manchester": {"latitude": 53.4808, "longitude": -2.2426},
-        "birmingham": {"latitude": 52.4862, "longitude": -1.8904},
-        "new york": {"latitude": 40.7128, "longitude": -74.006},
-        "newyork": {"latitude": 40.7128, "longitude": -74.006},
-        "miami": {"latitude": 25.7617, "longitude": -80.1918},
-        "los angeles": {"latitude": 34.0522, "longitude": -118.2437},
-        "chicago": {"latitude": 41.8781, "longitude": -87.6298},
-        "lima": {"latitude": -12.0464, "longitude": -77.0428},
-        "harare": {"latitude": -17.8292, "longitude": 31.0522},
-        "johannesburg": {"latitude": -26.2041, "longitude": 28.0473},
-        "cape town": {"latitude": -33.9249, "longitude": 18.4241},
-        "canberra": {"latitude": -35.2809, "longitude": 149.13},
-        "sydney": {"latitude": -33.8688, "longitude": 151.2093},
-        "melbourne": {"latitude": -37.8136, "longitude": 144.9631},
-        "brisbane": {"latitude": -27.4698, "longitude": 153.0251},
-        "perth": {"latitude": -31.9505, "longitude": 115.8605}
-    }
+    return _CITY_COORDS
 
 def to_dms(deg: float) -> List[int]:
     """Convert decimal degrees to degrees, minutes, seconds"""
@@ -269,36 +298,285 @@ def dms_to_datetime_offset(dms_time: List[int], base_jd: float, tz_offset: float
         # Convert to local datetime
         return jd_to_local_datetime_precise(target_jd, "Bengaluru")
         
-    except Exception as e:
-        print(f"Error converting DMS to datetime: {e}")
+    except Exception:
+        logger.exception("Error converting DMS to datetime")
         return datetime.now()
 
 def jd_to_local_datetime_precise(jd: float, city: str) -> datetime:
     """Convert Julian Day to precise local datetime"""
     try:
-        # Convert JD to Gregorian date
-        cal_date = swe.revjul(jd)
-        year, month, day, hour_float = cal_date[:4]
+        # Convert JD to Gregorian date without a round trip through swe.revjul
+        return julian_day_to_naive_datetime(jd)
         
-        hours = int(hour_float)
-        minutes = int((hour_float - hours) * 60)
-        seconds = int(((hour_float - hours) * 60 - minutes) * 60)
-        
-        # Handle date overflow
-        if hours >= 24:
-            day += 1
-            hours -= 24
-        elif hours < 0:
-            day -= 1
-            hours += 24
-            
-        return datetime(int(year), int(month), int(day), hours, minutes, seconds)
-        
-    except Exception as e:
-        print(f"Error in precise JD conversion: {e}")
+    except Exception:
+        logger.exception("Error in precise JD conversion")
         return datetime.now()
 
 
+def _nakshatra_at(jd: float, city: str, rise_jd: float, tz_offset: float) -> Dict[str, str]:
+    """Nakshatra from the shared sunrise (UTC JD) and timezone offset"""
+    # 2. Swiss Ephemeris gives Sayana, subtract ayanamsa for Nirayana
+    offsets = _SAMPLE_OFFSETS
+    _, moon, ayanamsa = _ephem_batch(rise_jd)
+    longitudes = [(lunar_long - ayan) % 360 for lunar_long, ayan in zip(moon, ayanamsa)]
+    
+    # 3. Today's nakshatra when offset = 0
+    # There are 27 Nakshatras spanning 360 degrees
+    nak = int(longitudes[0] / NAKSHATRA_DEGREES) % 27 + 1
+    
+    # 4. Find end time by 5-point inverse Lagrange interpolation
+    y = unwrap_angles(longitudes)
+    x = offsets
+    weights = lagrange_weights(y)  # shared by the end and start targets
+    approx_end = inverse_lagrange(x, y, nak * NAKSHATRA_DEGREES, weights)
+    ends_hours = (rise_jd - jd + approx_end) * 24 + tz_offset
+    
+    # 5. Check for skipped nakshatra
+    nak_tmrw = int(longitudes[-1] / NAKSHATRA_DEGREES) % 27 + 1
+    isSkipped = (nak_tmrw - nak) % 27 > 1
+    
+    # Convert timing to proper format
+    end_dt = jd_to_local_datetime_precise(jd + (ends_hours/24), city)
+    
+    # Calculate start time (previous nakshatra end)
+    # Target stays unwrapped (0 degrees for Ashwini) to match y
+    prev_approx_end = inverse_lagrange(x, y, (nak - 1) * NAKSHATRA_DEGREES, weights)
+    start_hours = (rise_jd - jd + prev_approx_end) * 24 + tz_offset
+    start_dt = jd_to_local_datetime_precise(jd + (start_hours/24), city)
+    
+    # Get nakshatra name (nak is already wrapped to 1-27)
+    nakshatra_name = NAKSHATRA_NAMES[nak - 1]
+    
+    result = {
+        "name": nakshatra_name,
+        "start": start_dt.isoformat(),
+        "end": end_dt.isoformat(),
+        "start_dt": start_dt,
+        "end_dt": end_dt
+    }
+    
+    # Handle skipped nakshatra
+    if isSkipped:
+        leap_nak = (nak % 27) + 1
+        logger.debug("Skipped nakshatra detected: %s", NAKSHATRA_NAMES[leap_nak - 1])
+    
+    return result
+
+def _karana_at(jd: float, city: str, rise_jd: float, tz_offset: float) -> Dict[str, str]:
+    """Karana from the shared sunrise (UTC JD) and timezone offset.
+    A karana is half a tithi, so its boundaries come from the same
+    relative-motion interpolation as calculate_tithi"""
+    # 2. Find karana at sunrise
+    # Each karana is 6 degrees (half of tithi)
+    # There are 60 karanas in a lunar month (30 tithis × 2)
+    sun, moon, _ = _ephem_batch(rise_jd)
+    moon_phase = (moon[0] - sun[0]) % 360
+    karana_number = int(moon_phase / KARANA_DEGREES) % 60 + 1
+    degrees_left = karana_number * KARANA_DEGREES - moon_phase
+    
+    # 3. Find end time by 4-point inverse Lagrange interpolation
+    relative_motion, _ = sweep_motion(rise_jd)
+    y = relative_motion
+    x = _SWEEP_OFFSETS
+    weights = lagrange_weights(y)  # shared by the end and start targets
+    approx_end = inverse_lagrange(x, y, degrees_left, weights)
+    ends_hours = (rise_jd + approx_end - jd) * 24 + tz_offset
+    end_dt = jd_to_local_datetime_precise(jd + (ends_hours/24), city)
+    
+    # Calculate start time (previous karana end, before sunrise)
+    prev_approx_end = inverse_lagrange(x, y, degrees_left - KARANA_DEGREES, weights)
+    start_hours = (rise_jd + prev_approx_end - jd) * 24 + tz_offset
+    start_dt = jd_to_local_datetime_precise(jd + (start_hours/24), city)
+    
+    # Map karana number to name
+    karana_name = KARANA_NAME_BY_NUM[karana_number]
+    
+    return {
+        "name": karana_name,
+        "start": start_dt.isoformat(),
+        "end": end_dt.isoformat(),
+        "start_dt": start_dt,
+        "end_dt": end_dt
+    }
+
+def _yoga_at(jd: float, city: str, rise_jd: float, tz_offset: float) -> Dict[str, str]:
+    """Yoga from the shared sunrise (UTC JD) and timezone offset"""
+    # 2. Find the Nirayana longitudes and add them
+    sun, moon, ayan = _ephem_batch(rise_jd)
+    ayanamsa = ayan[0]
+    lunar_long = (moon[0] - ayanamsa) % 360
+    solar_long = (sun[0] - ayanamsa) % 360
+    total = (lunar_long + solar_long) % 360
+    
+    # There are 27 Yogas spanning 360 degrees
+    yog = int(total / YOGA_DEGREES) % 27 + 1
+    
+    # 3. Find how many degrees left to be swept
+    degrees_left = yog * YOGA_DEGREES - total
+    
+    # 4. Compute longitudinal sums at intervals from sunrise
+    offsets = _SWEEP_OFFSETS
+    _, total_motion = sweep_motion(rise_jd)
+    
+    # 5. Find end time by 4-point inverse Lagrange interpolation
+    y = total_motion
+    x = offsets
+    weights = lagrange_weights(y)  # shared by the end and start targets
+    approx_end = inverse_lagrange(x, y, degrees_left, weights)
+    ends_hours = (rise_jd + approx_end - jd) * 24 + tz_offset
+    
+    # 6. Check for skipped yoga
+    ayanamsa_tmrw = ayan[-1]
+    lunar_long_tmrw = (moon[-1] - ayanamsa_tmrw) % 360
+    solar_long_tmrw = (sun[-1] - ayanamsa_tmrw) % 360
+    total_tmrw = (lunar_long_tmrw + solar_long_tmrw) % 360
+    tomorrow = int(total_tmrw / YOGA_DEGREES) % 27 + 1
+    isSkipped = (tomorrow - yog) % 27 > 1
+    
+    # Convert timing to proper format
+    end_dt = jd_to_local_datetime_precise(jd + (ends_hours/24), city)
+    
+    # Calculate start time (previous yoga end)
+    # Signed target, so the first yoga does not wrap to 360 degrees
+    prev_degrees_left = (yog - 1) * YOGA_DEGREES - total
+    prev_approx_end = inverse_lagrange(x, y, prev_degrees_left, weights)
+    start_hours = (rise_jd + prev_approx_end - jd) * 24 + tz_offset
+    start_dt = jd_to_local_datetime_precise(jd + (start_hours/24), city)
+    
+    # Get yoga name (yog is already wrapped to 1-27)
+    yoga_name = YOGA_NAMES[yog - 1]
+    
+    result = {
+        "name": yoga_name,
+        "start": start_dt.isoformat(),
+        "end": end_dt.isoformat(),
+        "start_dt": start_dt,
+        "end_dt": end_dt
+    }
+    
+    # Handle skipped yoga
+    if isSkipped:
+        leap_yog = (yog % 27) + 1
+        logger.debug("Skipped yoga detected: %s", YOGA_NAMES[leap_yog - 1])
+    
+    return result
+
+def _sunrise_utc(jd: float, city: str) -> Tuple[float, float]:
+    """Sunrise for the day of jd as a UTC Julian Day, with the city's timezone offset"""
+    # Get city coordinates and timezone
+    latitude, longitude = _city_latlon(city)
+    tz_offset = _city_tz_offset(city)
+    
+    # Create place tuple for DrikPanchanga format
+    place = (latitude, longitude, tz_offset)
+    
+    # Find time of sunrise (in UTC)
+    rise_result = calculate_sunrise_for_panchang(jd, place, city)
+    rise_jd = rise_result[0] - tz_offset / 24  # Convert to UTC
+    return rise_jd, tz_offset
+
+# Positions of each element in the tuple returned by _panchang_core
+_TITHI, _NAKSHATRA, _KARANA, _YOGA = range(4)
+
+@lru_cache(maxsize=256)
+def _panchang_core(jd: float, city: str) -> Tuple[Dict[str, str], ...]:
+    """Tithi, nakshatra, karana and yoga for jd, sharing one sunrise lookup.
+    
+    Cached because the period view probes the same days for every element.
+    Each period also carries its boundaries as start_dt/end_dt datetimes;
+    callers must copy the returned dicts (see _public_period) before
+    handing them out. Errors propagate, so no placeholder period (which
+    is stamped with the current time) is ever cached."""
+    rise_jd, tz_offset = _sunrise_utc(jd, city)
+    return (
+        _tithi_at(jd, city, rise_jd, tz_offset),
+        _nakshatra_at(jd, city, rise_jd, tz_offset),
+        _karana_at(jd, city, rise_jd, tz_offset),
+        _yoga_at(jd, city, rise_jd, tz_offset)
+    )
+
+# Each element with its own placeholder on failure. Applied outside the
+# cached _panchang_core, so a placeholder (stamped with the current time)
+# is never cached and one failing element doesn't take down the others.
+_safe_tithi_at = _panchang_safe("Shukla Paksha Pratipada", 24)(_tithi_at)
+_safe_nakshatra_at = _panchang_safe("Ashwini", 24)(_nakshatra_at)
+_safe_karana_at = _panchang_safe("Bava", 12)(_karana_at)
+_safe_yoga_at = _panchang_safe("Vishkambha", 24)(_yoga_at)
+
+def _panchang_elements(jd: float, city: str) -> Tuple[Dict[str, str], ...]:
+    """_panchang_core for jd, falling back element by element if it fails"""
+    try:
+        return _panchang_core(jd, city)
+    except Exception:
+        pass  # Recomputed below, where each failing element is logged
+    
+    try:
+        rise_jd, tz_offset = _sunrise_utc(jd, city)
+    except Exception:
+        logger.exception("Error finding sunrise for panchang")
+        return (
+            _fallback_period("Shukla Paksha Pratipada", 24),
+            _fallback_period("Ashwini", 24),
+            _fallback_period("Bava", 12),
+            _fallback_period("Vishkambha", 24)
+        )
+    
+    return (
+        _safe_tithi_at(jd, city, rise_jd, tz_offset),
+        _safe_nakshatra_at(jd, city, rise_jd, tz_offset),
+        _safe_karana_at(jd, city, rise_jd, tz_offset),
+        _safe_yoga_at(jd, city, rise_jd, tz_offset)
+    )
+
+def _panchang_batch(jds: List[float], city: str) -> Dict[float, Tuple[Dict[str, str], ...]]:
+    """_panchang_core for several days at once, keyed by jd.
+    
+    Each day goes through the cached _panchang_core, so overlapping ranges
+    (e.g. the period view for consecutive dates) are only computed once.
+    Days that fail are left out and reported."""
+    results = {}
+    for test_jd in jds:
+        try:
+            results[test_jd] = _panchang_core(test_jd, city)
+        except Exception:
+            logger.exception("Error calculating period for JD %s", test_jd)
+    return results
+
+def calculate_panchang_all(jd: float, city: str) -> Dict[str, Dict[str, str]]:
+    """
+    Calculate Tithi, Nakshatra, Karana and Yoga together
+    
+    Sunrise, timezone and the Sun/Moon samples are computed once and
+    shared by all four elements.
+    
+    Args:
+        jd: Julian Day Number
+        city: City name for timezone conversion
+        
+    Returns:
+        Dictionary keyed by element, each with name, start time, and end time
+    """
+    tithi, nakshatra, karana, yoga = _panchang_elements(jd, city)
+    return {
+        "tithi": _public_period(tithi),
+        "nakshatra": _public_period(nakshatra),
+        "karana": _public_period(karana),
+        "yoga": _public_period(yoga)
+    }
+
+def calculate_tithi(jd: float, city: str) -> Dict[str, str]:
+    """
+    Calculate Tithi (lunar day) using exact DrikPanchanga algorithm
+    
+    Args:
+        jd: Julian Day Number
+        city: City name for timezone conversion
+        
+    Returns:
+        Dictionary with tithi name, start time, and end time
+    """
+    return _public_period(_panchang_elements(jd, city)[_TITHI])
+
 def calculate_nakshatra(jd: float, city: str) -> Dict[str, str]:
     """
     Calculate Nakshatra using exact DrikPanchanga algorithm
@@ -310,77 +588,7 @@ def calculate_nakshatra(jd: float, city: str) -> Dict[str, str]:
     Returns:
         Dictionary with nakshatra name, start time, and end time
     """
-    try:
-        # Set Lahiri Ayanamsa
-        swe.set_sid_mode(swe.SIDM_LAHIRI)
-        
-        # Get city coordinates and timezone
-        city_coords = get_city_coordinates(city)
-        latitude = city_coords.get('latitude', 12.9719)
-        longitude = city_coords.get('longitude', 77.593)
-        tz_offset = get_timezone_offset(city, longitude)
-        
-        # Create place tuple
-        place = (latitude, longitude, tz_offset)
-        
-        # 1. Find time of sunrise (in UTC)
-        rise_result = calculate_sunrise_for_panchang(jd, place)
-        rise_jd = rise_result[0] - tz_offset / 24  # Convert to UTC
-        
-        # 2. Swiss Ephemeris gives Sayana, subtract ayanamsa for Nirayana
-        offsets = [0.0, 0.25, 0.5, 0.75, 1.0]
-        longitudes = [(lunar_longitude(rise_jd + t) - swe.get_ayanamsa_ut(rise_jd + t)) % 360 for t in offsets]
-        
-        # 3. Today's nakshatra when offset = 0
-        # There are 27 Nakshatras spanning 360 degrees
-        nak = ceil(longitudes[0] * 27 / 360)
-        if nak > 27:
-            nak = 1  # Wrap around
-        
-        # 4. Find end time by 5-point inverse Lagrange interpolation
-        y = unwrap_angles(longitudes)
-        x = offsets
-        approx_end = inverse_lagrange(x, y, nak * 360 / 27)
-        ends_hours = (rise_jd - jd + approx_end) * 24 + tz_offset
-        
-        # 5. Check for skipped nakshatra
-        nak_tmrw = ceil(longitudes[-1] * 27 / 360)
-        isSkipped = (nak_tmrw - nak) % 27 > 1
-        
-        # Convert timing to proper format
-        end_dt = jd_to_local_datetime_precise(jd + (ends_hours/24), city)
-        
-        # Calculate start time (previous nakshatra end)
-        prev_nak = (nak - 2) % 27 + 1
-        prev_approx_end = inverse_lagrange(x, y, prev_nak * 360 / 27)
-        start_hours = (rise_jd - jd + prev_approx_end) * 24 + tz_offset
-        start_dt = jd_to_local_datetime_precise(jd + (start_hours/24), city)
-        
-        # Get nakshatra name (1-based to 0-based indexing)
-        nakshatra_name = NAKSHATRA_NAMES[(nak - 1) % 27]
-        
-        result = {
-            "name": nakshatra_name,
-            "start": start_dt.isoformat(),
-            "end": end_dt.isoformat()
-        }
-        
-        # Handle skipped nakshatra
-        if isSkipped:
-            leap_nak = (nak % 27) + 1
-            print(f"Skipped nakshatra detected: {NAKSHATRA_NAMES[(leap_nak - 1) % 27]}")
-        
-        return result
-        
-    except Exception as e:
-        print(f"Error calculating nakshatra: {e}")
-        import traceback
-        traceback.print_exc()
-        return {
-            "name": "Ashwini",
-            "start": datetime.now().isoformat(),
-            "end": (datetime.now() + timedelta(hours=24)).isoformat()
-        }
+    return _public_period(_panchang_elements(jd, city)[_NAKSHATRA])
 
 def calculate_karana(jd: float, city: str) -> Dict[str, str]:
     """
@@ -393,77 +601,7 @@ def calculate_karana(jd: float, city: str) -> Dict[str, str]:
     Returns:
         Dictionary with karana name, start time, and end time
     """
-    try:
-        # Get city coordinates and timezone
-        city_coords = get_city_coordinates(city)
-        latitude = city_coords.get('latitude', 12.9719)
-        longitude = city_coords.get('longitude', 77.593)
-        tz_offset = get_timezone_offset(city, longitude)
-        
-        # Calculate lunar phase (moon - sun longitude)
-        moon_long = lunar_longitude(jd)
-        sun_long = solar_longitude(jd)
-        lunar_phase = (moon_long - sun_long) % 360
-        
-        # Each karana is 6 degrees (half of tithi)
-        # There are 60 karanas in a lunar month (30 tithis × 2)
-        karana_number = int(lunar_phase / 6) + 1
-        if karana_number > 60:
-            karana_number = 1
-        
-        # Map karana number to name (simplified)
-        if karana_number <= 56:
-            # Movable karanas (cycle through first 7)
-            karana_index = (karana_number - 1) % 7
-        else:
-            # Fixed karanas (last 4)
-            karana_index = 7 + (karana_number - 57)
-        
-        # Ensure bounds safety
-        karana_index = min(karana_index, len(KARANA_NAMES) - 1)
-        karana_name = KARANA_NAMES[karana_index]
-        
-        # Calculate approximate start and end times
-        # Each karana lasts about 6 degrees of lunar motion (roughly 12 hours)
-        
-        # Start: when current karana began
-        start_phase = (karana_number - 1) * 6
-        degrees_since_start = lunar_phase - start_phase
-        if degrees_since_start < 0:
-            degrees_since_start += 360
-            
-        # Estimate time for degrees (moon moves ~13.2 degrees per day)
-        hours_since_start = degrees_since_start / 13.2 * 24
-        start_jd = jd - hours_since_start / 24
-        
-        # End: when current karana ends
-        end_phase = karana_number * 6
-        degrees_to_end = end_phase - lunar_phase
-        if degrees_to_end <= 0:
-            degrees_to_end += 360
-            
-        hours_to_end = degrees_to_end / 13.2 * 24
-        end_jd = jd + hours_to_end / 24
-        
-        # Convert to local datetime
-        start_dt = jd_to_local_datetime_precise(start_jd, city)
-        end_dt = jd_to_local_datetime_precise(end_jd, city)
-        
-        return {
-            "name": karana_name,
-            "start": start_dt.isoformat(),
-            "end": end_dt.isoformat()
-        }
-        
-    except Exception as e:
-        print(f"Error calculating karana: {e}")
-        import traceback
-        traceback.print_exc()
-        return {
-            "name": "Bava",
-            "start": datetime.now().isoformat(),
-            "end": (datetime.now() + timedelta(hours=12)).isoformat()
-        }
+    return _public_period(_panchang_elements(jd, city)[_KARANA])
 
 def calculate_yoga(jd: float, city: str) -> Dict[str, str]:
     """
@@ -476,124 +614,41 @@ def calculate_yoga(jd: float, city: str) -> Dict[str, str]:
     Returns:
         Dictionary with yoga name, start time, and end time
     """
-    try:
-        # Set Lahiri Ayanamsa
-        swe.set_sid_mode(swe.SIDM_LAHIRI)
-        
-        # Get city coordinates and timezone
-        city_coords = get_city_coordinates(city)
-        latitude = city_coords.get('latitude', 12.9719)
-        longitude = city_coords.get('longitude', 77.593)
-        tz_offset = get_timezone_offset(city, longitude)
-        
-        # Create place tuple
-        place = (latitude, longitude, tz_offset)
-        
-        # 1. Find time of sunrise (in UTC)
-        rise_result = calculate_sunrise_for_panchang(jd, place)
-        rise_jd = rise_result[0] - tz_offset / 24  # Convert to UTC
-        
-        # 2. Find the Nirayana longitudes and add them
-        lunar_long = (lunar_longitude(rise_jd) - swe.get_ayanamsa_ut(rise_jd)) % 360
-        solar_long = (solar_longitude(rise_jd) - swe.get_ayanamsa_ut(rise_jd)) % 360
-        total = (lunar_long + solar_long) % 360
-        
-        # There are 27 Yogas spanning 360 degrees
-        yog = ceil(total * 27 / 360)
-        if yog > 27:
-            yog = 1  # Wrap around
-        
-        # 3. Find how many degrees left to be swept
-        degrees_left = yog * (360 / 27) - total
-        
-        # 4. Compute longitudinal sums at intervals from sunrise
-        offsets = [0.25, 0.5, 0.75, 1.0]
-        lunar_long_diff = [(lunar_longitude(rise_jd + t) - lunar_longitude(rise_jd)) % 360 for t in offsets]
-        solar_long_diff = [(solar_longitude(rise_jd + t) - solar_longitude(rise_jd)) % 360 for t in offsets]
-        total_motion = [moon + sun for (moon, sun) in zip(lunar_long_diff, solar_long_diff)]
-        
-        # 5. Find end time by 4-point inverse Lagrange interpolation
-        y = total_motion
-        x = offsets
-        approx_end = inverse_lagrange(x, y, degrees_left)
-        ends_hours = (rise_jd + approx_end - jd) * 24 + tz_offset
-        
-        # 6. Check for skipped yoga
-        lunar_long_tmrw = (lunar_longitude(rise_jd + 1) - swe.get_ayanamsa_ut(rise_jd + 1)) % 360
-        solar_long_tmrw = (solar_longitude(rise_jd + 1) - swe.get_ayanamsa_ut(rise_jd + 1)) % 360
-        total_tmrw = (lunar_long_tmrw + solar_long_tmrw) % 360
-        tomorrow = ceil(total_tmrw * 27 / 360)
-        isSkipped = (tomorrow - yog) % 27 > 1
-        
-        # Convert timing to proper format
-        end_dt = jd_to_local_datetime_precise(jd + (ends_hours/24), city)
-        
-        # Calculate start time (previous yoga end)
-        prev_yog = (yog - 2) % 27 + 1
-        prev_degrees_left = prev_yog * (360 / 27) - total
-        prev_approx_end = inverse_lagrange(x, y, prev_degrees_left)
-        start_hours = (rise_jd + prev_approx_end - jd) * 24 + tz_offset
-        start_dt = jd_to_local_datetime_precise(jd + (start_hours/24), city)
-        
-        # Get yoga name (1-based to 0-based indexing)
-        yoga_name = YOGA_NAMES[(yog - 1) % 27]
-        
-        result = {
-            "name": yoga_name,
-            "start": start_dt.isoformat(),
-            "end": end_dt.isoformat()
-        }
-        
-        # Handle skipped yoga
-        if isSkipped:
-            leap_yog = (yog % 27) + 1
-            print(f"Skipped yoga detected: {YOGA_NAMES[(leap_yog - 1) % 27]}")
-        
-        return result
-        
-    except Exception as e:
-        print(f"Error calculating yoga: {e}")
-        import traceback
-        traceback.print_exc()
-        return {
-            "name": "Vishkambha",
-            "start": datetime.now().isoformat(),
-            "end": (datetime.now() + timedelta(hours=24)).isoformat()
-        }
+    return _public_period(_panchang_elements(jd, city)[_YOGA])
 
 def get_city_coordinates(city: str) -> Dict[str, float]:
     """Get coordinates for supported cities"""
-    coordinates = {
-        "bengaluru": {"latitude": 12.9719, "longitude": 77.593},
-        "bangalore": {"latitude": 12.9719, "longitude": 77.593},
-        "mumbai": {"latitude": 19.0760, "longitude": 72.8777},
-        "delhi": {"latitude": 28.6139, "longitude": 77.2090},
-        "chennai": {"latitude": 13.0827, "longitude": 80.2707},
-        "kolkata": {"latitude": 22.5726, "longitude": 88.3639},
-        "hyderabad": {"latitude": 17.3850, "longitude": 78.4867},
-        "pune": {"latitude": 18.5204, "longitude": 73.8567},
-        "coventry": {"latitude": 52.40656, "longitude": -1.51217},
-        "london": {"latitude": 51.5074, "longitude": -0.1278},
-        "manchester": {"latitude": 53.4808, "longitude": -2.2426},
-        "birmingham": {"latitude": 52.4862, "longitude": -1.8904},
-        "new york": {"latitude": 40.7128, "longitude": -74.006},
-        "newyork": {"latitude": 40.7128, "longitude": -74.006},
-        "miami": {"latitude": 25.7617, "longitude": -80.1918},
-        "los angeles": {"latitude": 34.0522, "longitude": -118.2437},
-        "chicago": {"latitude": 41.8781, "longitude": -87.6298},
-        "lima": {"latitude": -12.0464, "longitude": -77.0428},
-        "harare": {"latitude": -17.8292, "longitude": 31.0522},
-        "johannesburg": {"latitude": -26.2041, "longitude": 28.0473},
-        "cape town": {"latitude": -33.9249, "longitude": 18.4241},
-        "canberra": {"latitude": -35.2809, "longitude": 149.13},
-        "sydney": {"latitude": -33.8688, "longitude": 151.2093},
-        "melbourne": {"latitude": -37.8136, "longitude": 144.9631},
-        "brisbane": {"latitude": -27.4698, "longitude": 153.0251},
-        "perth": {"latitude": -31.9505, "longitude": 115.8605}
+    city_lower = normalize_city_name(city)
+    return _CITY_COORDS.get(city_lower, _DEFAULT_COORDS)
+
+def _city_latlon(city: str) -> Tuple[float, float]:
+    """(latitude, longitude) for a supported city, Bengaluru if unknown"""
+    city_lower = normalize_city_name(city)
+    return CITY_COORDINATES.get(city_lower, DEFAULT_COORDINATES)
+
+@lru_cache(maxsize=256)
+def _city_tz_offset(city: str) -> float:
+    """Fixed timezone offset in hours for a city, resolved once per city name"""
+    _, longitude = _city_latlon(city)
+    return get_timezone_offset(city, longitude)
+
+# strftime format for the *_formatted fields of the periods response
+_TIME_12H_FORMAT = '%I:%M %p'
+
+# Period lists in the periods response, empty in the fallback response
+_PERIOD_LIST_KEYS = (
+    'tithis', 'nakshatras', 'karanas', 'yogas', 'auspicious_periods', 'inauspicious_periods'
+)
+
+def _period_entry(period: Dict) -> Dict[str, str]:
+    """Periods-response entry for a _panchang_core element period"""
+    return {
+        'name': period['name'],
+        'start': period['start'],
+        'end': period['end'],
+        'start_formatted': period['start_dt'].strftime(_TIME_12H_FORMAT),
+        'end_formatted': period['end_dt'].strftime(_TIME_12H_FORMAT)
     }
-    
-    city_lower = city.lower().replace(" ", "").replace("-", "")
-    return coordinates.get(city_lower, {"latitude": 12.9719, "longitude": 77.593})
 
 def calculate_all_periods_for_hindu_day(
     date: datetime, 
@@ -615,6 +670,9 @@ def calculate_all_periods_for_hindu_day(
     
     This matches ProKerala, DrikPanchang, and print Panchangam presentations.
     
+    Results are cached per (date, latitude, longitude); each call gets its
+    own deep copy, so callers may modify the returned structure.
+    
     Args:
         date: Date for calculation (local date)
         latitude: Latitude in degrees  
@@ -625,244 +683,178 @@ def calculate_all_periods_for_hindu_day(
         plus auspicious and inauspicious periods
     """
     try:
-        # Use existing fast sunrise calculation
-        from app.services.astronomical import calculate_sunrise_sunset
-        from app.services.muhurat import (
-            calculate_rahu_kalam, calculate_gulika_kalam, calculate_yamaganda_kalam,
-            calculate_abhijit_muhurat, calculate_brahma_muhurat, calculate_pradosha_time
-        )
-        city = "Bengaluru"  # Default city
-        
-        # Calculate Hindu day window: sunrise to next sunrise
-        sunrise_str, sunset_str = calculate_sunrise_sunset(date, latitude, longitude, city)
-        next_date = date + timedelta(days=1)
-        sunrise_next_str, _ = calculate_sunrise_sunset(next_date, latitude, longitude, city)
-        
-        # Calculate moonrise and moonset for the date
-        from app.services.astronomical import calculate_moonrise_moonset
-        moonrise_str, moonset_str = calculate_moonrise_moonset(date, latitude, longitude, city)
-        
-        def parse_time_to_datetime(date_obj: datetime, time_str: str) -> datetime:
-            """Parse time string to datetime object"""
-            try:
-                if "AM" in time_str or "PM" in time_str:
-                    time_part = time_str.replace(" AM", "").replace(" PM", "")
-                    hours, minutes = map(int, time_part.split(":"))
-                    if "PM" in time_str and hours != 12:
-                        hours += 12
-                    elif "AM" in time_str and hours == 12:
-                        hours = 0
-                else:
-                    hours, minutes = 6, 10  # Fallback
-                
-                return date_obj.replace(hour=hours, minute=minutes, second=0, microsecond=0)
-            except:
-                return date_obj.replace(hour=6, minute=10)
-        
-        # Define Hindu day window
-        hindu_day_start = parse_time_to_datetime(date, sunrise_str)
-        hindu_day_end = parse_time_to_datetime(next_date, sunrise_next_str)
-        
-        # Create ISO format times
-        sunrise_iso = f"{hindu_day_start.isoformat()}+05:30"
-        sunrise_next_iso = f"{hindu_day_end.isoformat()}+05:30"
-        sunset_iso = f"{parse_time_to_datetime(date, sunset_str).isoformat()}+05:30"
-        moonrise_iso = f"{parse_time_to_datetime(date, moonrise_str).isoformat()}+05:30"
-        moonset_iso = f"{parse_time_to_datetime(date, moonset_str).isoformat()}+05:30"
-        
-        print(f"Hindu day window: {hindu_day_start} to {hindu_day_end}")
-        
-        # Calculate Julian Day and use existing optimized functions
-        from app.utils.timezone import local_to_utc
-        utc_date = local_to_utc(date, city)
-        jd = get_julian_day_ut(utc_date)
-        
-        def format_time_12hour_simple(iso_time_str):
-            """Format ISO time to 12-hour format"""
-            try:
-                dt = datetime.fromisoformat(iso_time_str.replace('Z', '+00:00').replace('+05:30', ''))
-                return dt.strftime('%I:%M %p')
-            except:
-                return "12:00 PM"  # Fallback
-        
-        def periods_overlap_with_hindu_day(period_start_str: str, period_end_str: str) -> bool:
-            """Check if a period overlaps with the Hindu day window"""
-            try:
-                # Parse period times (remove timezone info for comparison)
-                period_start = datetime.fromisoformat(period_start_str.replace('Z', '').replace('+05:30', ''))
-                period_end = datetime.fromisoformat(period_end_str.replace('Z', '').replace('+05:30', ''))
-                
-                # Check for overlap: period_start < hindu_day_end AND period_end > hindu_day_start
-                return period_start < hindu_day_end and period_end > hindu_day_start
-            except:
-                return True  # Include if parsing fails
-        
-        def get_overlapping_periods(calc_func, jd_range, city):
-            """Get all periods that overlap with Hindu day window"""
-            all_periods = []
-            seen_periods = set()
-            
-            for test_jd in jd_range:
-                try:
-                    period_data = calc_func(test_jd, city)
-                    
-                    # Check if this period overlaps with Hindu day
-                    if periods_overlap_with_hindu_day(period_data['start'], period_data['end']):
-                        # Create unique key to avoid exact duplicates
-                        period_key = f"{period_data['name']}_{period_data['start']}_{period_data['end']}"
-                        
-                        if period_key not in seen_periods:
-                            all_periods.append({
-                                'name': period_data['name'],
-                                'start': period_data['start'],
-                                'end': period_data['end'],
-                                'start_formatted': format_time_12hour_simple(period_data['start']),
-                                'end_formatted': format_time_12hour_simple(period_data['end'])
-                            })
-                            seen_periods.add(period_key)
-                except Exception as e:
-                    print(f"Error calculating period for JD {test_jd}: {e}")
-                    continue
-            
-            # Sort by start time and return
-            all_periods.sort(key=lambda x: x['start'])
-            return all_periods
-        
-        # Calculate periods for extended range to catch all overlaps
-        # Check 2 days before to 2 days after, but limit karana range to avoid incorrect long periods
-        jd_range = [jd - 2, jd - 1, jd, jd + 1, jd + 2]
-        jd_range_karana = [jd - 1, jd, jd + 1]  # Smaller range for karanas to avoid calculation errors
-        
-        # Get overlapping periods for each element type
-        tithis = get_overlapping_periods(calculate_tithi, jd_range, city)
-        nakshatras = get_overlapping_periods(calculate_nakshatra, jd_range, city)
-        karanas = get_overlapping_periods(calculate_karana, jd_range_karana, city)  # Use smaller range
-        yogas = get_overlapping_periods(calculate_yoga, jd_range, city)
-        
-        # Calculate auspicious and inauspicious periods for the Hindu day
-        auspicious_periods = []
-        inauspicious_periods = []
-        
-        def format_muhurat_period(muhurat_data, name):
-            """Convert muhurat data to consistent format"""
-            if not (muhurat_data.get('start') and muhurat_data.get('end')):
-                return None
-                
-            # Parse time strings like "16:30" to create full datetime
-            try:
-                start_time = muhurat_data['start']  # "16:30"
-                end_time = muhurat_data['end']      # "18:00"
-                
-                # Parse hours and minutes
-                start_hour, start_min = map(int, start_time.split(':'))
-                end_hour, end_min = map(int, end_time.split(':'))
-                
-                # Create datetime objects for the requested date
-                start_dt = date.replace(hour=start_hour, minute=start_min, second=0, microsecond=0)
-                end_dt = date.replace(hour=end_hour, minute=end_min, second=0, microsecond=0)
-                
-                # Handle case where end time is next day
-                if end_hour < start_hour:
-                    end_dt = end_dt + timedelta(days=1)
-                
-                return {
-                    'name': name,
-                    'start': f"{start_dt.isoformat()}+05:30",
-                    'end': f"{end_dt.isoformat()}+05:30",
-                    'start_formatted': start_dt.strftime('%I:%M %p'),
-                    'end_formatted': end_dt.strftime('%I:%M %p')
-                }
-            except Exception as e:
-                print(f"Error formatting {name}: {e}")
-                return None
-        
-        try:
-            # Auspicious periods
-            abhijit_data = calculate_abhijit_muhurat(date, latitude, longitude, city)
-            abhijit_period = format_muhurat_period(abhijit_data, 'Abhijit Muhurat')
-            if abhijit_period:
-                auspicious_periods.append(abhijit_period)
-            
-            brahma_data = calculate_brahma_muhurat(date, latitude, longitude, city)
-            brahma_period = format_muhurat_period(brahma_data, 'Brahma Muhurat')
-            if brahma_period:
-                auspicious_periods.append(brahma_period)
-            
-            pradosha_data = calculate_pradosha_time(date, latitude, longitude, city)
-            pradosha_period = format_muhurat_period(pradosha_data, 'Pradosha Time')
-            if pradosha_period:
-                auspicious_periods.append(pradosha_period)
-            
-            # Inauspicious periods
-            rahu_data = calculate_rahu_kalam(date, latitude, longitude, city)
-            rahu_period = format_muhurat_period(rahu_data, 'Rahu Kalam')
-            if rahu_period:
-                inauspicious_periods.append(rahu_period)
-            
-            gulika_data = calculate_gulika_kalam(date, latitude, longitude, city)
-            gulika_period = format_muhurat_period(gulika_data, 'Gulika Kalam')
-            if gulika_period:
-                inauspicious_periods.append(gulika_period)
-            
-            yamaganda_data = calculate_yamaganda_kalam(date, latitude, longitude, city)
-            yamaganda_period = format_muhurat_period(yamaganda_data, 'Yamaganda Kalam')
-            if yamaganda_period:
-                inauspicious_periods.append(yamaganda_period)
-        except Exception as e:
-            print(f"Error calculating muhurat periods: {e}")
-        
-        # Ensure we have at least some periods (fallback)
-        if not tithis:
-            tithi_data = calculate_tithi(jd, city)
-            tithis = [{
-                'name': tithi_data['name'],
-                'start': tithi_data['start'],
-                'end': tithi_data['end'],
-                'start_formatted': format_time_12hour_simple(tithi_data['start']),
-                'end_formatted': format_time_12hour_simple(tithi_data['end'])
-            }]
-        
-        print(f"Found {len(tithis)} Tithis, {len(nakshatras)} Nakshatras, {len(karanas)} Karanas, {len(yogas)} Yogas")
-        print(f"Found {len(auspicious_periods)} Auspicious periods, {len(inauspicious_periods)} Inauspicious periods")
-        
+        return copy.deepcopy(_periods_for_hindu_day(date, latitude, longitude))
+    except Exception:
+        logger.exception("Error in periods calculation")
+        # Return simple fallback response
         return {
-            'date': date.strftime('%Y-%m-%d'),
+            'date': date.date().isoformat(),
             'location': {'latitude': latitude, 'longitude': longitude},
-            'sunrise': sunrise_iso,
-            'sunset': sunset_iso,
-            'moonrise': moonrise_iso,
-            'moonset': moonset_iso,
-            'sunrise_next': sunrise_next_iso,
-            'hindu_day_start': hindu_day_start.isoformat(),
-            'hindu_day_end': hindu_day_end.isoformat(),
-            'tithis': tithis,
-            'nakshatras': nakshatras,
-            'karanas': karanas,
-            'yogas': yogas,
-            'auspicious_periods': auspicious_periods,
-            'inauspicious_periods': inauspicious_periods
+            'sunrise': date.replace(hour=6, minute=10, tzinfo=IST).isoformat(),
+            'sunset': date.replace(hour=18, minute=30, tzinfo=IST).isoformat(),
+            'moonrise': date.replace(hour=7, minute=0, tzinfo=IST).isoformat(),
+            'moonset': date.replace(hour=19, minute=0, tzinfo=IST).isoformat(),
+            'sunrise_next': (date + timedelta(days=1)).replace(hour=6, minute=10, tzinfo=IST).isoformat(),
+            **{key: [] for key in _PERIOD_LIST_KEYS}
         }
-        
-    except Exception as e:
-        print(f"Error in periods calculation: {e}")
-        import traceback
-        traceback.print_exc()
-        # Return simple fallback response
+
+@lru_cache(maxsize=128)
+def _periods_for_hindu_day(
+    date: datetime, 
+    latitude: float, 
+    longitude: float
+) -> Dict[str, any]:
+    """Uncached body of calculate_all_periods_for_hindu_day; raises on failure
+    so that error responses are never cached. Do not mutate the result."""
+    from app.services.muhurat import (
+        rahu_kalam_window, gulika_kalam_window, yamaganda_kalam_window,
+        abhijit_muhurat_window, brahma_muhurat_window, pradosha_time_window
+    )
+    city = "Bengaluru"  # Default city
+    
+    # Calculate Hindu day window: sunrise to next sunrise
+    sunrise_str, sunset_str = calculate_sunrise_sunset(date, latitude, longitude, city)
+    next_date = date + timedelta(days=1)
+    sunrise_next_str, _ = calculate_sunrise_sunset(next_date, latitude, longitude, city)
+    
+    # Calculate moonrise and moonset for the date
+    from app.services.astronomical import calculate_moonrise_moonset
+    moonrise_str, moonset_str = calculate_moonrise_moonset(date, latitude, longitude, city)
+    
+    def parse_time_to_datetime(date_obj: datetime, time_str: str) -> datetime:
+        """Parse time string to datetime object"""
+        try:
+            parsed = parse_time_12hour(time_str)
+            hours, minutes = parsed if parsed else (6, 10)  # Fallback
+            if "(+1)" in time_str:
+                date_obj += timedelta(days=1)  # e.g. moonset after midnight
+            
+            return date_obj.replace(hour=hours, minute=minutes, second=0, microsecond=0)
+        except:
+            return date_obj.replace(hour=6, minute=10)
+    
+    # Define Hindu day window
+    hindu_day_start = parse_time_to_datetime(date, sunrise_str)
+    hindu_day_end = parse_time_to_datetime(next_date, sunrise_next_str)
+    
+    # Create ISO format times
+    sunrise_iso = hindu_day_start.replace(tzinfo=IST).isoformat()
+    sunrise_next_iso = hindu_day_end.replace(tzinfo=IST).isoformat()
+    sunset_iso = parse_time_to_datetime(date, sunset_str).replace(tzinfo=IST).isoformat()
+    moonrise_iso = parse_time_to_datetime(date, moonrise_str).replace(tzinfo=IST).isoformat()
+    moonset_iso = parse_time_to_datetime(date, moonset_str).replace(tzinfo=IST).isoformat()
+    
+    logger.debug("Hindu day window: %s to %s", hindu_day_start, hindu_day_end)
+    
+    # Calculate Julian Day and use existing optimized functions
+    from app.utils.timezone import local_to_utc
+    utc_date = local_to_utc(date, city)
+    jd = get_julian_day_ut(utc_date)
+    
+    def periods_overlap_with_hindu_day(period_start: datetime, period_end: datetime) -> bool:
+        """Check if a period overlaps with the Hindu day window"""
+        # Check for overlap: period_start < hindu_day_end AND period_end > hindu_day_start
+        return period_start < hindu_day_end and period_end > hindu_day_start
+    
+    def get_overlapping_periods(element, jd_range):
+        """Get all periods of one panchang element that overlap with Hindu day window"""
+        all_periods = []
+        seen_periods = set()
+        
+        for test_jd in jd_range:
+            if test_jd not in panchang_by_jd:
+                continue
+            try:
+                period_data = panchang_by_jd[test_jd][element]
+                
+                # Check if this period overlaps with Hindu day
+                if periods_overlap_with_hindu_day(period_data['start_dt'], period_data['end_dt']):
+                    # Same element instance seen from another probe day: keep the first
+                    period_key = (period_data['name'], period_data['start'])
+                    
+                    if period_key not in seen_periods:
+                        all_periods.append((period_data['start_dt'], _period_entry(period_data)))
+                        seen_periods.add(period_key)
+            except Exception:
+                logger.exception("Error calculating period for JD %s", test_jd)
+                continue
+        
+        # Sort by start datetime and return
+        all_periods.sort(key=itemgetter(0))
+        return [period for _, period in all_periods]
+    
+    # Calculate periods for extended range to catch all overlaps
+    # Check 2 days before to 2 days after, but limit karana range to avoid incorrect long periods
+    jd_range = [jd - 2, jd - 1, jd, jd + 1, jd + 2]
+    jd_range_karana = [jd - 1, jd, jd + 1]  # Smaller range for karanas to avoid calculation errors
+    
+    # Evaluate all four elements once per probe day
+    panchang_by_jd = _panchang_batch(jd_range, city)
+    
+    # Get overlapping periods for each element type
+    tithis = get_overlapping_periods(_TITHI, jd_range)
+    nakshatras = get_overlapping_periods(_NAKSHATRA, jd_range)
+    karanas = get_overlapping_periods(_KARANA, jd_range_karana)  # Use smaller range
+    yogas = get_overlapping_periods(_YOGA, jd_range)
+    
+    # Calculate auspicious and inauspicious periods for the Hindu day
+    auspicious_periods = []
+    inauspicious_periods = []
+    
+    def format_muhurat_period(name, start_dt, end_dt):
+        """Convert a muhurat window to the periods response format"""
         return {
-            'date': date.strftime('%Y-%m-%d'),
-            'location': {'latitude': latitude, 'longitude': longitude},
-            'sunrise': f"{date.replace(hour=6, minute=10).isoformat()}+05:30",
-            'sunset': f"{date.replace(hour=18, minute=30).isoformat()}+05:30",
-            'moonrise': f"{date.replace(hour=7, minute=0).isoformat()}+05:30",
-            'moonset': f"{date.replace(hour=19, minute=0).isoformat()}+05:30",
-            'sunrise_next': f"{(date + timedelta(days=1)).replace(hour=6, minute=10).isoformat()}+05:30",
-            'tithis': [],
-            'nakshatras': [],
-            'karanas': [],
-            'yogas': [],
-            'auspicious_periods': [],
-            'inauspicious_periods': []
+            'name': name,
+            'start': start_dt.replace(tzinfo=IST).isoformat(),
+            'end': end_dt.replace(tzinfo=IST).isoformat(),
+            'start_formatted': start_dt.strftime(_TIME_12H_FORMAT),
+            'end_formatted': end_dt.strftime(_TIME_12H_FORMAT)
         }
+    
+    muhurat_windows = (
+        # Auspicious periods
+        ('Abhijit Muhurat', abhijit_muhurat_window, auspicious_periods),
+        ('Brahma Muhurat', brahma_muhurat_window, auspicious_periods),
+        ('Pradosha Time', pradosha_time_window, auspicious_periods),
+        # Inauspicious periods
+        ('Rahu Kalam', rahu_kalam_window, inauspicious_periods),
+        ('Gulika Kalam', gulika_kalam_window, inauspicious_periods),
+        ('Yamaganda Kalam', yamaganda_kalam_window, inauspicious_periods),
+    )
+    for name, window, periods in muhurat_windows:
+        try:
+            start_dt, end_dt = window(date, latitude, longitude, city)
+        except Exception:
+            logger.exception("Error calculating %s", name)
+            continue
+        periods.append(format_muhurat_period(name, start_dt, end_dt))
+    
+    # Ensure we have at least some periods (fallback)
+    if not tithis:
+        tithis = [_period_entry(_panchang_core(jd, city)[_TITHI])]
+    
+    logger.debug("Found %d Tithis, %d Nakshatras, %d Karanas, %d Yogas",
+                 len(tithis), len(nakshatras), len(karanas), len(yogas))
+    logger.debug("Found %d Auspicious periods, %d Inauspicious periods",
+                 len(auspicious_periods), len(inauspicious_periods))
+    
+    return {
+        'date': date.date().isoformat(),
+        'location': {'latitude': latitude, 'longitude': longitude},
+        'sunrise': sunrise_iso,
+        'sunset': sunset_iso,
+        'moonrise': moonrise_iso,
+        'moonset': moonset_iso,
+        'sunrise_next': sunrise_next_iso,
+        'hindu_day_start': hindu_day_start.isoformat(),
+        'hindu_day_end': hindu_day_end.isoformat(),
+        'tithis': tithis,
+        'nakshatras': nakshatras,
+        'karanas': karanas,
+        'yogas': yogas,
+        'auspicious_periods': auspicious_periods,
+        'inauspicious_periods': inauspicious_periods
+    }
 
 def parse_sunrise_to_iso(date: datetime, sunrise_str: str, tz_offset: float) -> str:
     """
@@ -877,52 +869,32 @@ def parse_sunrise_to_iso(date: datetime, sunrise_str: str, tz_offset: float) ->
         ISO format datetime string with timezone
     """
     try:
-        # Parse the time string
-        time_part = sunrise_str.replace(" AM", "").replace(" PM", "")
-        hours, minutes = map(int, time_part.split(":"))
-        
-        # Convert to 24-hour format
-        if "PM" in sunrise_str and hours != 12:
-            hours += 12
-        elif "AM" in sunrise_str and hours == 12:
-            hours = 0
+        # Parse the time string into 24-hour format
+        parsed = parse_time_12hour(sunrise_str)
+        if parsed is None:
+            raise ValueError(f"Unrecognised sunrise time: {sunrise_str!r}")
+        hours, minutes = parsed
             
         # Create datetime with timezone
-        sunrise_dt = date.replace(hour=hours, minute=minutes, second=0, microsecond=0)
-        
-        # Format timezone offset
-        tz_hours = int(tz_offset)
-        tz_minutes = int((tz_offset - tz_hours) * 60)
-        tz_str = f"{tz_hours:+03d}:{tz_minutes:02d}"
-        
-        return f"{sunrise_dt.isoformat()}{tz_str}"
+        sunrise_dt = date.replace(
+            hour=hours, minute=minutes, second=0, microsecond=0, tzinfo=tz_for(tz_offset)
+        )
+        return sunrise_dt.isoformat()
         
-    except Exception as e:
-        print(f"Error parsing sunrise time: {e}")
+    except Exception:
+        logger.exception("Error parsing sunrise time")
         # Fallback to default
-        return f"{date.replace(hour=6, minute=0).isoformat()}+05:30"
+        return date.replace(hour=6, minute=0, tzinfo=IST).isoformat()
 
 def jd_to_local_datetime(jd: float, city: str) -> datetime:
     """Convert Julian Day to local datetime for a specific city"""
     try:
         # Get timezone offset
-        city_coords = get_city_coordinates(city)
-        longitude = city_coords.get('longitude', 77.593)
-        tz_offset = get_timezone_offset(city, longitude)
-        
-        # Adjust JD to local time
-        local_jd = jd + tz_offset/24.0
-        
-        # Convert to Gregorian calendar
-        cal_date = swe.revjul(local_jd)
-        year, month, day, hour_float = cal_date[:4]
-        
-        hours = int(hour_float)
-        minutes = int((hour_float - hours) * 60)
-        seconds = int(((hour_float - hours) * 60 - minutes) * 60)
+        tz_offset = _city_tz_offset(city)
         
-        return datetime(int(year), int(month), int(day), hours, minutes, seconds)
+        # Adjust JD to local time and convert to the Gregorian calendar
+        return julian_day_to_naive_datetime(jd + tz_offset/24.0)
         
-    except Exception as e:
-        print(f"Error converting JD to datetime: {e}")
+    except Exception:
+        logger.exception("Error converting JD to datetime")
         return datetime.now()
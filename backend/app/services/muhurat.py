@@ -1,11 +1,101 @@
 """
 Muhurat calculations - Auspicious and Inauspicious periods
 """
+import logging
 import swisseph as swe
 from datetime import datetime, timezone, timedelta
 from typing import Dict, List, Tuple
 from app.utils.timezone import get_julian_day_ut, julian_day_to_datetime, format_time_24hour
-from app.services.astronomical import calculate_sunrise_sunset
+from app.services.astronomical import calculate_sunrise_sunset_dt
+from app.utils.constants import RAHU_KALAM_SLOTS, GULIKA_KALAM_SLOTS, YAMAGANDA_KALAM_SLOTS, MUHURAT_FALLBACK_TIMES
+
+logger = logging.getLogger(__name__)
+
+def _sunrise_sunset(
+    date: datetime, 
+    latitude: float, 
+    longitude: float, 
+    city: str
+) -> Tuple[datetime, datetime]:
+    """
+    Sunrise/sunset for the calendar date of `date`, shared by all muhurat helpers
+    
+    Args:
+        date: Date for calculation (local date)
+        latitude: Latitude in degrees
+        longitude: Longitude in degrees
+        city: City name for timezone
+        
+    Returns:
+        Tuple of (sunrise, sunset) as naive local datetimes
+        
+    Raises:
+        ValueError: If the sun does not rise or set on this date
+    """
+    sunrise, sunset = calculate_sunrise_sunset_dt(date, latitude, longitude, city)
+    if sunrise is None or sunset is None:
+        raise ValueError(f"No sunrise/sunset on {date.date()} at ({latitude}, {longitude})")
+    return sunrise, sunset
+
+def _kalam_window(
+    date: datetime, 
+    latitude: float, 
+    longitude: float, 
+    city: str, 
+    slots: Tuple[int, ...]
+) -> Tuple[datetime, datetime]:
+    """
+    Start and end of a kalam that occupies one 1/8th segment of daytime
+    
+    Args:
+        date: Date for calculation
+        latitude: Latitude in degrees
+        longitude: Longitude in degrees
+        city: City name for timezone
+        slots: Segment number (1-8) for each weekday, Monday first
+        
+    Returns:
+        Tuple of (start, end) as naive local datetimes
+    """
+    sunrise_time, sunset_time = _sunrise_sunset(date, latitude, longitude, city)
+    
+    # Each period is 1/8 of the day
+    period = (sunset_time - sunrise_time) / 8
+    
+    slot = slots[date.weekday()]
+    start_time = sunrise_time + (slot - 1) * period
+    end_time = start_time + period
+    
+    # Sunrise/sunset are only known to the minute, so report minutes
+    return (
+        start_time.replace(second=0, microsecond=0),
+        end_time.replace(second=0, microsecond=0)
+    )
+
+def _format_window(window: Tuple[datetime, datetime]) -> Dict[str, str]:
+    """Render a (start, end) window as the {"start": "HH:MM", "end": "HH:MM"} dict"""
+    start_time, end_time = window
+    return {
+        "start": format_time_24hour(start_time),
+        "end": format_time_24hour(end_time)
+    }
+
+def _fallback_times(key: str) -> Dict[str, str]:
+    """Default {"start", "end"} times for a muhurat that could not be calculated"""
+    start, end = MUHURAT_FALLBACK_TIMES[key]
+    return {"start": start, "end": end}
+
+def rahu_kalam_window(date: datetime, latitude: float, longitude: float, city: str) -> Tuple[datetime, datetime]:
+    """Rahu Kalam as (start, end) local datetimes; raises if there is no sunrise/sunset"""
+    return _kalam_window(date, latitude, longitude, city, RAHU_KALAM_SLOTS)
+
+def gulika_kalam_window(date: datetime, latitude: float, longitude: float, city: str) -> Tuple[datetime, datetime]:
+    """Gulika Kalam as (start, end) local datetimes; raises if there is no sunrise/sunset"""
+    return _kalam_window(date, latitude, longitude, city, GULIKA_KALAM_SLOTS)
+
+def yamaganda_kalam_window(date: datetime, latitude: float, longitude: float, city: str) -> Tuple[datetime, datetime]:
+    """Yamaganda Kalam as (start, end) local datetimes; raises if there is no sunrise/sunset"""
+    return _kalam_window(date, latitude, longitude, city, YAMAGANDA_KALAM_SLOTS)
 
 def calculate_rahu_kalam(
     date: datetime, 
@@ -26,59 +116,12 @@ def calculate_rahu_kalam(
         Dictionary with start and end times
     """
     try:
-        # Get sunrise and sunset
-        sunrise_str, sunset_str = calculate_sunrise_sunset(date, latitude, longitude, city)
-        
-        # Convert to datetime objects for calculation
-        sunrise_time = datetime.strptime(sunrise_str.replace(' AM', '').replace(' PM', ''), '%I:%M')
-        sunset_time = datetime.strptime(sunset_str.replace(' AM', '').replace(' PM', ''), '%I:%M')
-        
-        # Adjust for AM/PM
-        if 'PM' in sunset_str and sunset_time.hour != 12:
-            sunset_time = sunset_time.replace(hour=sunset_time.hour + 12)
-        if 'AM' in sunrise_str and sunrise_time.hour == 12:
-            sunrise_time = sunrise_time.replace(hour=0)
-        
-        # Calculate day duration in minutes
-        if sunset_time.hour < sunrise_time.hour:
-            sunset_time = sunset_time.replace(hour=sunset_time.hour + 24)
-        
-        day_duration = (sunset_time.hour - sunrise_time.hour) * 60 + (sunset_time.minute - sunrise_time.minute)
-        
-        # Each period is 1/8 of the day
-        period_duration = day_duration // 8
-        
-        # Rahu Kalam timing depends on day of week
-        weekday = date.weekday()  # 0=Monday, 6=Sunday
-        
-        # Rahu Kalam periods (as 1/8th segments from sunrise)
-        rahu_periods = {
-            0: 1,  # Monday - 2nd period
-            1: 6,  # Tuesday - 7th period  
-            2: 4,  # Wednesday - 5th period
-            3: 5,  # Thursday - 6th period
-            4: 3,  # Friday - 4th period
-            5: 2,  # Saturday - 3rd period
-            6: 4   # Sunday - 5th period
-        }
-        
-        rahu_period = rahu_periods.get(weekday, 4)
-        
-        # Calculate start and end times
-        start_minutes = (rahu_period - 1) * period_duration
-        end_minutes = rahu_period * period_duration
-        
-        start_time = sunrise_time + timedelta(minutes=start_minutes)
-        end_time = sunrise_time + timedelta(minutes=end_minutes)
-        
-        return {
-            "start": format_time_24hour(start_time),
-            "end": format_time_24hour(end_time)
-        }
-        
-    except Exception as e:
-        print(f"Error calculating Rahu Kalam: {e}")
-        return {"start": "16:30", "end": "18:00"}
+        window = rahu_kalam_window(date, latitude, longitude, city)
+    except Exception:
+        logger.exception("Error calculating Rahu Kalam")
+        return _fallback_times("rahu_kalam")
+    
+    return _format_window(window)
 
 def calculate_gulika_kalam(
     date: datetime, 
@@ -99,55 +142,12 @@ def calculate_gulika_kalam(
         Dictionary with start and end times
     """
     try:
-        # Get sunrise and sunset
-        sunrise_str, sunset_str = calculate_sunrise_sunset(date, latitude, longitude, city)
-        
-        # Convert to datetime objects
-        sunrise_time = datetime.strptime(sunrise_str.replace(' AM', '').replace(' PM', ''), '%I:%M')
-        sunset_time = datetime.strptime(sunset_str.replace(' AM', '').replace(' PM', ''), '%I:%M')
-        
-        # Adjust for AM/PM
-        if 'PM' in sunset_str and sunset_time.hour != 12:
-            sunset_time = sunset_time.replace(hour=sunset_time.hour + 12)
-        if 'AM' in sunrise_str and sunrise_time.hour == 12:
-            sunrise_time = sunrise_time.replace(hour=0)
-        
-        # Calculate day duration
-        if sunset_time.hour < sunrise_time.hour:
-            sunset_time = sunset_time.replace(hour=sunset_time.hour + 24)
-        
-        day_duration = (sunset_time.hour - sunrise_time.hour) * 60 + (sunset_time.minute - sunrise_time.minute)
-        period_duration = day_duration // 8
-        
-        # Gulika Kalam periods (different from Rahu Kalam)
-        weekday = date.weekday()
-        gulika_periods = {
-            0: 6,  # Monday - 7th period
-            1: 4,  # Tuesday - 5th period
-            2: 5,  # Wednesday - 6th period
-            3: 3,  # Thursday - 4th period
-            4: 2,  # Friday - 3rd period
-            5: 1,  # Saturday - 2nd period
-            6: 7   # Sunday - 8th period
-        }
-        
-        gulika_period = gulika_periods.get(weekday, 4)
-        
-        # Calculate start and end times
-        start_minutes = (gulika_period - 1) * period_duration
-        end_minutes = gulika_period * period_duration
-        
-        start_time = sunrise_time + timedelta(minutes=start_minutes)
-        end_time = sunrise_time + timedelta(minutes=end_minutes)
-        
-        return {
-            "start": format_time_24hour(start_time),
-            "end": format_time_24hour(end_time)
-        }
-        
-    except Exception as e:
-        print(f"Error calculating Gulika Kalam: {e}")
-        return {"start": "14:00", "end": "15:30"}
+        window = gulika_kalam_window(date, latitude, longitude, city)
+    except Exception:
+        logger.exception("Error calculating Gulika Kalam")
+        return _fallback_times("gulika_kalam")
+    
+    return _format_window(window)
 
 def calculate_yamaganda_kalam(
     date: datetime, 
@@ -168,55 +168,12 @@ def calculate_yamaganda_kalam(
         Dictionary with start and end times
     """
     try:
-        # Get sunrise and sunset
-        sunrise_str, sunset_str = calculate_sunrise_sunset(date, latitude, longitude, city)
-        
-        # Convert to datetime objects
-        sunrise_time = datetime.strptime(sunrise_str.replace(' AM', '').replace(' PM', ''), '%I:%M')
-        sunset_time = datetime.strptime(sunset_str.replace(' AM', '').replace(' PM', ''), '%I:%M')
-        
-        # Adjust for AM/PM
-        if 'PM' in sunset_str and sunset_time.hour != 12:
-            sunset_time = sunset_time.replace(hour=sunset_time.hour + 12)
-        if 'AM' in sunrise_str and sunrise_time.hour == 12:
-            sunrise_time = sunrise_time.replace(hour=0)
-        
-        # Calculate day duration
-        if sunset_time.hour < sunrise_time.hour:
-            sunset_time = sunset_time.replace(hour=sunset_time.hour + 24)
-        
-        day_duration = (sunset_time.hour - sunrise_time.hour) * 60 + (sunset_time.minute - sunrise_time.minute)
-        period_duration = day_duration // 8
-        
-        # Yamaganda periods
-        weekday = date.weekday()
-        yamaganda_periods = {
-            0: 4,  # Monday - 5th period
-            1: 3,  # Tuesday - 4th period
-            2: 2,  # Wednesday - 3rd period
-            3: 1,  # Thursday - 2nd period
-            4: 7,  # Friday - 8th period
-            5: 5,  # Saturday - 6th period
-            6: 6   # Sunday - 7th period
-        }
-        
-        yamaganda_period = yamaganda_periods.get(weekday, 4)
-        
-        # Calculate start and end times
-        start_minutes = (yamaganda_period - 1) * period_duration
-        end_minutes = yamaganda_period * period_duration
-        
-        start_time = sunrise_time + timedelta(minutes=start_minutes)
-        end_time = sunrise_time + timedelta(minutes=end_minutes)
-        
-        return {
-            "start": format_time_24hour(start_time),
-            "end": format_time_24hour(end_time)
-        }
-        
-    except Exception as e:
-        print(f"Error calculating Yamaganda Kalam: {e}")
-        return {"start": "09:00", "end": "10:30"}
+        window = yamaganda_kalam_window(date, latitude, longitude, city)
+    except Exception:
+        logger.exception("Error calculating Yamaganda Kalam")
+        return _fallback_times("yamaganda_kalam")
+    
+    return _format_window(window)
 
 def calculate_varjyam(
     date: datetime, 
@@ -241,12 +198,7 @@ def calculate_varjyam(
         # This is a simplified calculation
         
         # Get some reference times
-        sunrise_str, sunset_str = calculate_sunrise_sunset(date, latitude, longitude, city)
-        
-        # Convert to 24-hour format for calculation
-        sunrise_time = datetime.strptime(sunrise_str.replace(' AM', '').replace(' PM', ''), '%I:%M')
-        if 'AM' in sunrise_str and sunrise_time.hour == 12:
-            sunrise_time = sunrise_time.replace(hour=0)
+        sunrise_time, _ = _sunrise_sunset(date, latitude, longitude, city)
         
         # Calculate some typical Varjyam periods
         # These are approximations based on traditional calculations
@@ -273,9 +225,26 @@ def calculate_varjyam(
         
         return varjyam_periods
         
-    except Exception as e:
-        print(f"Error calculating Varjyam: {e}")
-        return [{"start": "12:30", "end": "13:15"}]
+    except Exception:
+        logger.exception("Error calculating Varjyam")
+        return [_fallback_times("varjyam")]
+
+def abhijit_muhurat_window(date: datetime, latitude: float, longitude: float, city: str) -> Tuple[datetime, datetime]:
+    """Abhijit Muhurat as (start, end) local datetimes; raises if there is no sunrise/sunset"""
+    # Get sunrise and sunset
+    sunrise_time, sunset_time = _sunrise_sunset(date, latitude, longitude, city)
+    
+    # Calculate solar noon (midpoint between sunrise and sunset)
+    total_minutes = int((sunset_time - sunrise_time).total_seconds() // 60)
+    noon_minutes = total_minutes // 2
+    
+    solar_noon = sunrise_time + timedelta(minutes=noon_minutes)
+    
+    # Abhijit Muhurat is approximately 24 minutes centered around solar noon
+    start_time = solar_noon - timedelta(minutes=12)
+    end_time = solar_noon + timedelta(minutes=12)
+    
+    return start_time, end_time
 
 def calculate_abhijit_muhurat(
     date: datetime, 
@@ -296,40 +265,23 @@ def calculate_abhijit_muhurat(
         Dictionary with start and end times
     """
     try:
-        # Get sunrise and sunset
-        sunrise_str, sunset_str = calculate_sunrise_sunset(date, latitude, longitude, city)
-        
-        # Convert to datetime objects
-        sunrise_time = datetime.strptime(sunrise_str.replace(' AM', '').replace(' PM', ''), '%I:%M')
-        sunset_time = datetime.strptime(sunset_str.replace(' AM', '').replace(' PM', ''), '%I:%M')
-        
-        # Adjust for AM/PM
-        if 'PM' in sunset_str and sunset_time.hour != 12:
-            sunset_time = sunset_time.replace(hour=sunset_time.hour + 12)
-        if 'AM' in sunrise_str and sunrise_time.hour == 12:
-            sunrise_time = sunrise_time.replace(hour=0)
-        
-        # Calculate solar noon (midpoint between sunrise and sunset)
-        if sunset_time.hour < sunrise_time.hour:
-            sunset_time = sunset_time.replace(hour=sunset_time.hour + 24)
-        
-        total_minutes = (sunset_time.hour - sunrise_time.hour) * 60 + (sunset_time.minute - sunrise_time.minute)
-        noon_minutes = total_minutes // 2
-        
-        solar_noon = sunrise_time + timedelta(minutes=noon_minutes)
-        
-        # Abhijit Muhurat is approximately 24 minutes centered around solar noon
-        start_time = solar_noon - timedelta(minutes=12)
-        end_time = solar_noon + timedelta(minutes=12)
-        
-        return {
-            "start": format_time_24hour(start_time),
-            "end": format_time_24hour(end_time)
-        }
-        
-    except Exception as e:
-        print(f"Error calculating Abhijit Muhurat: {e}")
-        return {"start": "11:48", "end": "12:12"}
+        window = abhijit_muhurat_window(date, latitude, longitude, city)
+    except Exception:
+        logger.exception("Error calculating Abhijit Muhurat")
+        return _fallback_times("abhijit_muhurat")
+    
+    return _format_window(window)
+
+def brahma_muhurat_window(date: datetime, latitude: float, longitude: float, city: str) -> Tuple[datetime, datetime]:
+    """Brahma Muhurat as (start, end) local datetimes; raises if there is no sunrise/sunset"""
+    # Get sunrise
+    sunrise_time, _ = _sunrise_sunset(date, latitude, longitude, city)
+    
+    # Brahma Muhurat is 1 hour and 36 minutes before sunrise
+    end_time = sunrise_time - timedelta(minutes=36)
+    start_time = end_time - timedelta(hours=1)
+    
+    return start_time, end_time
 
 def calculate_brahma_muhurat(
     date: datetime, 
@@ -350,26 +302,23 @@ def calculate_brahma_muhurat(
         Dictionary with start and end times
     """
     try:
-        # Get sunrise
-        sunrise_str, _ = calculate_sunrise_sunset(date, latitude, longitude, city)
-        
-        # Convert to datetime object
-        sunrise_time = datetime.strptime(sunrise_str.replace(' AM', '').replace(' PM', ''), '%I:%M')
-        if 'AM' in sunrise_str and sunrise_time.hour == 12:
-            sunrise_time = sunrise_time.replace(hour=0)
-        
-        # Brahma Muhurat is 1 hour and 36 minutes before sunrise
-        end_time = sunrise_time - timedelta(minutes=36)
-        start_time = end_time - timedelta(hours=1)
-        
-        return {
-            "start": format_time_24hour(start_time),
-            "end": format_time_24hour(end_time)
-        }
-        
-    except Exception as e:
-        print(f"Error calculating Brahma Muhurat: {e}")
-        return {"start": "04:24", "end": "05:24"}
+        window = brahma_muhurat_window(date, latitude, longitude, city)
+    except Exception:
+        logger.exception("Error calculating Brahma Muhurat")
+        return _fallback_times("brahma_muhurat")
+    
+    return _format_window(window)
+
+def pradosha_time_window(date: datetime, latitude: float, longitude: float, city: str) -> Tuple[datetime, datetime]:
+    """Pradosha time as (start, end) local datetimes; raises if there is no sunrise/sunset"""
+    # Get sunset
+    _, sunset_time = _sunrise_sunset(date, latitude, longitude, city)
+    
+    # Pradosha time starts about 1.5 hours before sunset and lasts for 3 hours
+    start_time = sunset_time - timedelta(hours=1, minutes=30)
+    end_time = sunset_time + timedelta(hours=1, minutes=30)
+    
+    return start_time, end_time
 
 def calculate_pradosha_time(
     date: datetime, 
@@ -390,23 +339,9 @@ def calculate_pradosha_time(
         Dictionary with start and end times
     """
     try:
-        # Get sunset
-        _, sunset_str = calculate_sunrise_sunset(date, latitude, longitude, city)
-        
-        # Convert to datetime object
-        sunset_time = datetime.strptime(sunset_str.replace(' AM', '').replace(' PM', ''), '%I:%M')
-        if 'PM' in sunset_str and sunset_time.hour != 12:
-            sunset_time = sunset_time.replace(hour=sunset_time.hour + 12)
-        
-        # Pradosha time starts about 1.5 hours before sunset and lasts for 3 hours
-        start_time = sunset_time - timedelta(hours=1, minutes=30)
-        end_time = sunset_time + timedelta(hours=1, minutes=30)
-        
-        return {
-            "start": format_time_24hour(start_time),
-            "end": format_time_24hour(end_time)
-        }
-        
-    except Exception as e:
-        print(f"Error calculating Pradosha time: {e}")
-        return {"start": "17:00", "end": "20:00"}
\ No newline at end of file
+        window = pradosha_time_window(date, latitude, longitude, city)
+    except Exception:
+        logger.exception("Error calculating Pradosha time")
+        return _fallback_times("pradosha_time")
+    
+    return _format_window(window)
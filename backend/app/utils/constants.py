@@ -1,45 +1,52 @@
 """
 Constants used in Panchangam calculations
 """
+from types import MappingProxyType
 
 # Tithi names (Lunar day names)
-TITHI_NAMES = [
+TITHI_NAMES = (
     "Pratipada", "Dwitiya", "Tritiya", "Chaturthi", "Panchami",
     "Shashthi", "Saptami", "Ashtami", "Navami", "Dashami",
     "Ekadashi", "Dwadashi", "Trayodashi", "Chaturdashi", "Purnima",
     "Pratipada", "Dwitiya", "Tritiya", "Chaturthi", "Panchami",
     "Shashthi", "Saptami", "Ashtami", "Navami", "Dashami",
     "Ekadashi", "Dwadashi", "Trayodashi", "Chaturdashi", "Amavasya"
-]
+)
 
 # Nakshatra names (Star constellation names)
-NAKSHATRA_NAMES = [
+NAKSHATRA_NAMES = (
     "Ashwini", "Bharani", "Krittika", "Rohini", "Mrigashira",
     "Ardra", "Punarvasu", "Pushya", "Ashlesha", "Magha",
     "Purva Phalguni", "Uttara Phalguni", "Hasta", "Chitra", "Swati",
     "Vishakha", "Anuradha", "Jyeshtha", "Mula", "Purva Ashadha",
     "Uttara Ashadha", "Shravana", "Dhanishta", "Shatabhisha", "Purva Bhadrapada",
     "Uttara Bhadrapada", "Revati"
-]
+)
 
 # Karana names (Half-tithi names)
 # There are 60 karanas total:
 # 7 movable karanas repeat 8 times (56 total): Bava, Balava, Kaulava, Taitila, Gara, Vanija, Vishti
 # 4 fixed karanas (57-60): Shakuni, Chatushpada, Naga, Kimstughno
-KARANA_NAMES = [
+KARANA_NAMES = (
     "Bava", "Balava", "Kaulava", "Taitila", "Garija", "Vanija", "Vishti",  # 0-6: movable karanas
     "Shakuni", "Chatushpada", "Naga", "Kimstughno"  # 7-10: fixed karanas
-]
+)
+
+# Karana name by karana number (1-60): 1-56 cycle through the 7 movable
+# karanas, 57-60 are the fixed ones
+KARANA_NAME_BY_NUM = {
+    n: KARANA_NAMES[(n - 1) % 7 if n <= 56 else 7 + (n - 57)] for n in range(1, 61)
+}
 
 # Yoga names (Solar-Lunar combination names)
-YOGA_NAMES = [
+YOGA_NAMES = (
     "Vishkambha", "Priti", "Ayushman", "Saubhagya", "Shobhana",
     "Atiganda", "Sukarman", "Dhriti", "Shula", "Ganda",
     "Vriddhi", "Dhruva", "Vyaghata", "Harshana", "Vajra",
     "Siddhi", "Vyatipata", "Variyan", "Parigha", "Shiva",
     "Siddha", "Sadhya", "Shubha", "Shukla", "Brahma",
     "Indra", "Vaidhriti"
-]
+)
 
 # Paksha (Lunar fortnight) prefixes
 PAKSHA_NAMES = {
@@ -47,6 +54,11 @@ PAKSHA_NAMES = {
     1: "Krishna Paksha"  # Waning moon
 }
 
+# Full tithi names with paksha prefix, indexed by tithi number - 1
+TITHI_FULL_NAMES = tuple(
+    f"{PAKSHA_NAMES[i // 15]} {TITHI_NAMES[i]}" for i in range(30)
+)
+
 # Swiss Ephemeris planet constants
 SUN = 0
 MOON = 1
@@ -61,22 +73,84 @@ PLUTO = 9
 MEAN_NODE = 10
 TRUE_NODE = 11
 
-# Time zones for cities
-CITY_TIMEZONES = {
+# Time zones for cities; read-only since get_timezone_for_city caches per city
+CITY_TIMEZONES = MappingProxyType({
     "Bengaluru": "Asia/Kolkata",
     "Coventry": "Europe/London",
     "New York": "America/New_York",
     "Lima": "America/Lima",
     "Harare": "Africa/Harare",
     "Canberra": "Australia/Canberra"
+})
+
+# Coordinates of supported cities as (latitude, longitude), keyed by lower-case city name
+CITY_COORDINATES = {
+    "bengaluru": (12.9719, 77.593),
+    "bangalore": (12.9719, 77.593),
+    "mumbai": (19.0760, 72.8777),
+    "delhi": (28.6139, 77.2090),
+    "chennai": (13.0827, 80.2707),
+    "kolkata": (22.5726, 88.3639),
+    "hyderabad": (17.3850, 78.4867),
+    "pune": (18.5204, 73.8567),
+    "coventry": (52.40656, -1.51217),
+    "london": (51.5074, -0.1278),
+    "manchester": (53.4808, -2.2426),
+    "birmingham": (52.4862, -1.8904),
+    "new york": (40.7128, -74.006),
+    "newyork": (40.7128, -74.006),
+    "miami": (25.7617, -80.1918),
+    "los angeles": (34.0522, -118.2437),
+    "chicago": (41.8781, -87.6298),
+    "lima": (-12.0464, -77.0428),
+    "harare": (-17.8292, 31.0522),
+    "johannesburg": (-26.2041, 28.0473),
+    "cape town": (-33.9249, 18.4241),
+    "canberra": (-35.2809, 149.13),
+    "sydney": (-33.8688, 151.2093),
+    "melbourne": (-37.8136, 144.9631),
+    "brisbane": (-27.4698, 153.0251),
+    "perth": (-31.9505, 115.8605)
 }
 
+# Default (latitude, longitude) for unknown cities - Bengaluru
+DEFAULT_COORDINATES = (12.9719, 77.593)
+
+# Reverse lookup: coordinates rounded to 0.1 degree -> city name (first entry wins)
+COORD_TO_CITY = {}
+for _name, (_lat, _lon) in CITY_COORDINATES.items():
+    COORD_TO_CITY.setdefault((round(_lat, 1), round(_lon, 1)), _name)
+del _name, _lat, _lon
+
 # Degrees per Nakshatra (360/27)
 NAKSHATRA_DEGREES = 13.333333333333334
 
 # Degrees per Tithi (360/30)
 TITHI_DEGREES = 12.0
 
+# Degrees per Yoga (360/27)
+YOGA_DEGREES = 13.333333333333334
+
+# Degrees per Karana (half a Tithi)
+KARANA_DEGREES = 6.0
+
+# Kalam slots: the kalam runs from sunrise + (slot-1)/8 to sunrise + slot/8 of
+# daytime, indexed by weekday (0=Monday ... 6=Sunday)
+RAHU_KALAM_SLOTS = (1, 6, 4, 5, 3, 2, 4)
+GULIKA_KALAM_SLOTS = (6, 4, 5, 3, 2, 1, 7)
+YAMAGANDA_KALAM_SLOTS = (4, 3, 2, 1, 7, 5, 6)
+
+# Fallback (start, end) times in HH:MM, used when a muhurat cannot be calculated
+MUHURAT_FALLBACK_TIMES = {
+    "rahu_kalam": ("16:30", "18:00"),
+    "gulika_kalam": ("14:00", "15:30"),
+    "yamaganda_kalam": ("09:00", "10:30"),
+    "varjyam": ("12:30", "13:15"),
+    "abhijit_muhurat": ("11:48", "12:12"),
+    "brahma_muhurat": ("04:24", "05:24"),
+    "pradosha_time": ("17:00", "20:00"),
+}
+
 # Standard calculation flags for Swiss Ephemeris
 SIDEREAL_FLAG = 256  # SEFLG_SIDEREAL
 SPEED_FLAG = 2      # SEFLG_SPEED
\ No newline at end of file
@@ -1,20 +1,70 @@
 """
 Timezone utility functions for Panchangam calculations
 """
-import pytz
-from datetime import datetime, timezone
-from typing import Dict
+import logging
+import re
+from bisect import bisect_left
+from functools import lru_cache, singledispatch
+from datetime import date, datetime, timezone, timedelta
+from zoneinfo import ZoneInfo
+from typing import Dict, Optional, Tuple
 from app.utils.constants import CITY_TIMEZONES
 
-def get_timezone_for_city(city: str) -> pytz.BaseTzInfo:
+__all__ = [
+    "CITY_TIMEZONES", "IST", "tz_for", "normalize_city_name",
+    "get_timezone_for_city", "utc_to_local", "local_to_utc",
+    "format_time_12hour", "format_time_24hour", "parse_time_12hour",
+    "get_timezone_offset_for_coords", "get_timezone_offset",
+    "get_julian_day_ut", "julian_day_to_naive_datetime", "julian_day_to_datetime",
+]
+
+logger = logging.getLogger(__name__)
+
+# Indian Standard Time, the fixed offset used for the periods response
+IST = timezone(timedelta(hours=5, minutes=30))
+
+@lru_cache(maxsize=64)
+def tz_for(offset_hours: float) -> timezone:
+    """
+    Fixed-offset tzinfo for an offset in hours, shared per offset
+    
+    Args:
+        offset_hours: Offset from UTC in hours, e.g. 5.5
+        
+    Returns:
+        datetime.timezone instance
+    """
+    return timezone(timedelta(hours=offset_hours))
+
+# Clock time such as "6:05 AM" or "18:30"; the AM/PM suffix is optional
+_TIME_RE = re.compile(r'(\d{1,2}):(\d{2})\s*(AM|PM)?', re.IGNORECASE)
+
+@lru_cache(maxsize=256)
+def normalize_city_name(city: str) -> str:
+    """
+    Normalize a city name for table lookups: lower-case, spaces and hyphens removed
+    
+    Args:
+        city: City name as given by the caller, e.g. "New York"
+        
+    Returns:
+        Normalized key, e.g. "newyork"
+    """
+    return city.lower().replace(" ", "").replace("-", "")
+
+@lru_cache(maxsize=None)
+def get_timezone_for_city(city: str) -> ZoneInfo:
     """
     Get timezone object for a given city
     
+    Cached per city: CITY_TIMEZONES is static, and unknown cities raise
+    rather than adding cache entries.
+    
     Args:
         city: City name
         
     Returns:
-        pytz timezone object
+        ZoneInfo timezone object
         
     Raises:
         ValueError: If city is not supported
@@ -22,7 +72,7 @@ def get_timezone_for_city(city: str) -> pytz.BaseTzInfo:
     if city not in CITY_TIMEZONES:
         raise ValueError(f"Timezone not configured for city: {city}")
     
-    return pytz.timezone(CITY_TIMEZONES[city])
+    return ZoneInfo(CITY_TIMEZONES[city])
 
 def utc_to_local(utc_dt: datetime, city: str) -> datetime:
     """
@@ -39,6 +89,9 @@ def utc_to_local(utc_dt: datetime, city: str) -> datetime:
         utc_dt = utc_dt.replace(tzinfo=timezone.utc)
     
     local_tz = get_timezone_for_city(city)
+    if utc_dt.tzinfo is local_tz:
+        # Already in the city's zone (timezone objects are cached per city)
+        return utc_dt
     return utc_dt.astimezone(local_tz)
 
 def local_to_utc(local_dt: datetime, city: str) -> datetime:
@@ -54,64 +107,99 @@ def local_to_utc(local_dt: datetime, city: str) -> datetime:
     """
     local_tz = get_timezone_for_city(city)
     
-    # Localize the naive datetime
-    localized_dt = local_tz.localize(local_dt)
+    # Attach the zone to the naive datetime
+    localized_dt = local_dt.replace(tzinfo=local_tz)
     
     # Convert to UTC
     return localized_dt.astimezone(timezone.utc)
 
+# Clock strings for every minute of the day, indexed by hours * 60 + minutes:
+# "H:MM AM/PM", "HH:MM AM/PM" (strftime "%I:%M %p") and "HH:MM" ("%H:%M")
+_CLOCK_12H = tuple(
+    f"{(hours - 1) % 12 + 1}:{minutes:02d} {'AM' if hours < 12 else 'PM'}"
+    for hours in range(24) for minutes in range(60)
+)
+_CLOCK_12H_PADDED = tuple(clock.rjust(8, "0") for clock in _CLOCK_12H)
+_CLOCK_24H = tuple(
+    f"{hours:02d}:{minutes:02d}" for hours in range(24) for minutes in range(60)
+)
+
+@singledispatch
 def format_time_12hour(dt: datetime) -> str:
     """
     Format datetime to 12-hour format string (HH:MM AM/PM)
     
+    ISO strings are dispatched to the string overload below.
+    
     Args:
         dt: datetime object
         
     Returns:
         Formatted time string
     """
-    return dt.strftime("%I:%M %p")
+    return _CLOCK_12H_PADDED[dt.hour * 60 + dt.minute]
 
-def format_time_12hour(dt_str: str) -> str:
+@format_time_12hour.register
+def _(dt_str: str) -> str:
     """
     Format ISO datetime string to 12-hour format string (HH:MM AM/PM)
     
     Args:
-        dt_str: ISO datetime string
+        dt_str: ISO datetime string, or a bare "H:MM"/"HH:MM" time
         
     Returns:
         Formatted time string
     """
     try:
-        # Parse ISO string and extract time
-        if 'T' in dt_str:
-            time_part = dt_str.split('T')[1]
-        else:
-            time_part = dt_str
-            
-        # Remove timezone info if present
-        if '+' in time_part:
-            time_part = time_part.split('+')[0]
-        elif 'Z' in time_part:
-            time_part = time_part.replace('Z', '')
-            
-        # Parse hour and minute
-        hours, minutes = map(int, time_part.split(':')[:2])
-        
-        # Convert to 12-hour format
-        if hours == 0:
-            return f"12:{minutes:02d} AM"
-        elif hours < 12:
-            return f"{hours}:{minutes:02d} AM"
-        elif hours == 12:
-            return f"12:{minutes:02d} PM"
-        else:
-            return f"{hours-12}:{minutes:02d} PM"
+        # The time starts right after 'T' in a full ISO string, else at 0
+        parsed = parse_time_12hour(dt_str[dt_str.find('T') + 1:])
+        if parsed is None:
+            raise ValueError(f"no time in {dt_str!r}")
+        hours, minutes = parsed
+        if hours > 23 or minutes > 59:
+            raise ValueError(f"time out of range in {dt_str!r}")
+        return _CLOCK_12H[hours * 60 + minutes]
             
-    except Exception as e:
-        print(f"Error formatting time: {e}")
+    except Exception:
+        logger.exception("Error formatting time")
         return "12:00 PM"
 
+@lru_cache(maxsize=2048)
+def parse_time_12hour(time_str: str) -> Optional[Tuple[int, int]]:
+    """
+    Parse a "HH:MM AM/PM" time string into 24-hour hours and minutes
+    
+    Results are cached: the same sunrise/sunset strings recur for every
+    request on a given date and city.
+    
+    Args:
+        time_str: Time string, e.g. "6:05 AM"
+        
+    Returns:
+        Tuple of (hours, minutes), or None if the string holds no time
+    """
+    match = _TIME_RE.search(time_str)
+    if match is None:
+        return None
+    
+    hours = int(match.group(1))
+    minutes = int(match.group(2))
+    meridiem = match.group(3)
+    if meridiem:
+        hours = hours % 12 + (12 if meridiem.upper() == "PM" else 0)
+    return hours, minutes
+
+# (west, east, offset hours) longitude bands, sorted and inclusive at both
+# ends; a longitude on a shared edge belongs to the western band
+_LONGITUDE_BANDS = (
+    (-82.5, -67.5, -5.0),  # US East Coast and Lima
+    (-7.5, 22.5, 1.0),     # UK/Europe timezone
+    (22.5, 37.5, 2.0),     # Harare timezone
+    (67.5, 97.5, 5.5),     # India timezone
+    (135.0, 157.5, 10.0),  # Australia timezone
+)
+_LONGITUDE_BAND_ENDS = tuple(east for _, east, _ in _LONGITUDE_BANDS)
+
 def get_timezone_offset_for_coords(latitude: float, longitude: float) -> float:
     """
     Get timezone offset for given coordinates (simplified)
@@ -125,49 +213,47 @@ def get_timezone_offset_for_coords(latitude: float, longitude: float) -> float:
     """
     # Simplified timezone calculation based on longitude
     # For more accuracy, a proper timezone library should be used
-    if longitude >= 67.5 and longitude <= 97.5:  # India timezone
-        return 5.5
-    elif longitude >= -7.5 and longitude <= 22.5:  # UK/Europe timezone  
-        return 1.0
-    elif longitude >= -82.5 and longitude <= -67.5:  # US East Coast
-        return -5.0
-    elif longitude >= -82.5 and longitude <= -67.5:  # Lima timezone
-        return -5.0
-    elif longitude >= 22.5 and longitude <= 37.5:  # Harare timezone
-        return 2.0
-    elif longitude >= 135 and longitude <= 157.5:  # Australia timezone
-        return 10.0
-    else:
-        # Default to UTC
-        return 0.0
+    i = bisect_left(_LONGITUDE_BAND_ENDS, longitude)
+    if i < len(_LONGITUDE_BANDS) and longitude >= _LONGITUDE_BANDS[i][0]:
+        return _LONGITUDE_BANDS[i][2]
+    # Default to UTC
+    return 0.0
+
+@lru_cache(maxsize=4096)
+def _city_offset_on(city: str, day: date) -> float:
+    """UTC offset in hours for a configured city at local noon on the given day"""
+    tz = get_timezone_for_city(city)
+    noon = datetime(day.year, day.month, day.day, 12, tzinfo=tz)
+    return noon.utcoffset().total_seconds() / 3600
 
 def get_timezone_offset(city: str, longitude: float, date: datetime = None) -> float:
     """
     Get timezone offset for a city or coordinates
     
+    The offset for a configured city is memoized per local calendar day
+    and taken at local noon, so it only changes across DST transitions.
+    
     Args:
         city: City name
         longitude: Longitude for fallback calculation
-        date: Date for DST calculation (optional)
+        date: Date for DST calculation (optional, defaults to today)
         
     Returns:
         Timezone offset in hours
     """
     try:
         if city in CITY_TIMEZONES:
-            tz = pytz.timezone(CITY_TIMEZONES[city])
-            if date:
-                dt = tz.localize(date) if date.tzinfo is None else date.astimezone(tz)
-                return dt.utcoffset().total_seconds() / 3600
-            else:
+            if date is None:
                 # Use current time for DST calculation
-                dt = tz.localize(datetime.now())
-                return dt.utcoffset().total_seconds() / 3600
+                date = datetime.now()
+            elif date.tzinfo is not None:
+                date = date.astimezone(get_timezone_for_city(city))
+            return _city_offset_on(city, date.date())
         else:
             # Fallback to coordinate-based calculation
             return get_timezone_offset_for_coords(0, longitude)
-    except Exception as e:
-        print(f"Error getting timezone offset: {e}")
+    except Exception:
+        logger.exception("Error getting timezone offset")
         return get_timezone_offset_for_coords(0, longitude)
 
 def format_time_24hour(dt: datetime) -> str:
@@ -180,7 +266,10 @@ def format_time_24hour(dt: datetime) -> str:
     Returns:
         Formatted time string
     """
-    return dt.strftime("%H:%M")
+    return _CLOCK_24H[dt.hour * 60 + dt.minute]
+
+# Julian Day at midnight of date.toordinal() == 0 (0000-12-31, proleptic Gregorian)
+_JD_AT_ORDINAL_ZERO = 1721424.5
 
 def get_julian_day_ut(dt: datetime) -> float:
     """
@@ -195,36 +284,20 @@ def get_julian_day_ut(dt: datetime) -> float:
     if dt.tzinfo is not None:
         dt = dt.astimezone(timezone.utc).replace(tzinfo=None)
     
-    # Calculate Julian Day Number
-    year = dt.year
-    month = dt.month
-    day = dt.day
+    # Midnight JD is a fixed offset from the proleptic Gregorian ordinal
     hours = dt.hour + dt.minute/60.0 + dt.second/3600.0
-    
-    if month <= 2:
-        year -= 1
-        month += 12
-    
-    a = int(year / 100)
-    b = 2 - a + int(a / 4)
-    
-    jd = int(365.25 * (year + 4716)) + int(30.6001 * (month + 1)) + day + b - 1524.5
-    jd += hours / 24.0
-    
-    return jd
+    return dt.toordinal() + _JD_AT_ORDINAL_ZERO + hours / 24.0
 
-def julian_day_to_datetime(jd: float, city: str) -> datetime:
+def julian_day_to_naive_datetime(jd: float) -> datetime:
     """
-    Convert Julian Day Number to datetime in local timezone
+    Convert Julian Day Number to a naive datetime, truncated to the second
     
     Args:
-        jd: Julian Day Number
-        city: City name for timezone conversion
+        jd: Julian Day Number (in whatever time scale the caller uses)
         
     Returns:
-        Local datetime object
+        Naive datetime object
     """
-    # Convert JD to UTC datetime
     jd += 0.5
     z = int(jd)
     f = jd - z
@@ -251,5 +324,26 @@ def julian_day_to_datetime(jd: float, city: str) -> datetime:
     seconds = (minutes - minute) * 60
     second = int(seconds)
     
-    utc_dt = datetime(year, month, day, hour, minute, second, tzinfo=timezone.utc)
-    return utc_to_local(utc_dt, city)
\ No newline at end of file
+    return datetime(year, month, day, hour, minute, second)
+
+def julian_day_to_datetime(jd: float, city: str) -> datetime:
+    """
+    Convert Julian Day Number to datetime in local timezone
+    
+    Args:
+        jd: Julian Day Number
+        city: City name for timezone conversion
+        
+    Returns:
+        Local datetime object
+    """
+    return _utc_second_to_local(julian_day_to_naive_datetime(jd), city)
+
+@lru_cache(maxsize=8192)
+def _utc_second_to_local(utc_dt: datetime, city: str) -> datetime:
+    """
+    Local time for a naive UTC datetime, cached per whole second and city
+    
+    Julian Days that land in the same second share one timezone conversion.
+    """
+    return utc_to_local(utc_dt.replace(tzinfo=timezone.utc), city)
@@ -2,10 +2,11 @@
 """
 Debug coordinate system and calculations
 """
+import argparse
 import swisseph as swe
 import math
 
-def debug_sun_positions():
+def debug_sun_positions(verbose=False):
     """Debug sun positions around expected sunrise time"""
     print("=== Debugging Sun Positions ===")
     
@@ -27,25 +28,25 @@ def debug_sun_positions():
     print()
     
     # Check altitudes from midnight to 6 AM UTC
-    for hour_utc in [0, 1, 1.2, 1.4, 2, 3, 4, 5, 6]:
-        jd = swe.julday(year, month, day, hour_utc)
-        
-        # Get sun position
-        sun_result = swe.calc_ut(jd, swe.SUN, swe.FLG_SWIEPH)
-        if not sun_result:
-            continue
-            
-        # Extract position data correctly
-        sun_lon = sun_result[0][0]  # Longitude
-        ra = sun_result[0][5]       # Right ascension 
-        dec = sun_result[0][1]      # Declination
+    hours_utc = [0, 1, 1.2, 1.4, 2, 3, 4, 5, 6]
+    jds = [swe.julday(year, month, day, hour_utc) for hour_utc in hours_utc]
+    
+    # Get sun positions as equatorial coordinates: (RA, Dec, distance, ...)
+    ras, decs = [], []
+    for jd in jds:
+        sun_result = swe.calc_ut(jd, swe.SUN, swe.FLG_SWIEPH | swe.FLG_EQUATORIAL)
         
         # Debug: print raw results
-        print(f"  Raw result: {sun_result[0][:6]}")
-        
-        # Calculate altitude
-        altitude = calculate_sun_altitude(jd, ra, dec, lat, lon)
+        if verbose:
+            print(f"  Raw result: {sun_result[0][:6]}")
         
+        ras.append(sun_result[0][0])   # Right ascension
+        decs.append(sun_result[0][1])  # Declination
+    
+    # Calculate altitudes for the whole sweep at once
+    altitudes = calculate_sun_altitudes(jds, ras, decs, lat, lon, verbose)
+    
+    for hour_utc, ra, dec, altitude in zip(hours_utc, ras, decs, altitudes):
         # Convert to IST for display
         ist_hour = hour_utc + 5.5
         if ist_hour >= 24:
@@ -56,39 +57,45 @@ def debug_sun_positions():
         if -1 < altitude < 1:  # Near horizon
             print(f"    *** NEAR HORIZON ***")
 
-def calculate_sun_altitude(jd, ra, dec, latitude, longitude):
-    """Calculate sun altitude above horizon"""
-    # Greenwich Mean Sidereal Time
-    gmst = swe.sidtime(jd) * 15  # Convert hours to degrees
-    
-    # Local sidereal time
-    lst = gmst + longitude
-    
-    # Hour angle
-    hour_angle = lst - ra
-    
-    # Normalize hour angle to [-180, 180]
-    while hour_angle > 180:
-        hour_angle -= 360
-    while hour_angle < -180:
-        hour_angle += 360
-    
-    print(f"    Debug: GMST={gmst:6.1f}°, LST={lst:6.1f}°, HA={hour_angle:6.1f}°")
-    
-    # Convert to radians
+def calculate_sun_altitudes(jds, ras, decs, latitude, longitude, verbose=False):
+    """Calculate sun altitudes above horizon for parallel lists of instants and
+    RA/Dec, printing intermediates if verbose"""
+    # The observer's latitude terms are shared by every instant
     lat_rad = math.radians(latitude)
-    dec_rad = math.radians(dec)
-    ha_rad = math.radians(hour_angle)
-    
-    # Calculate altitude
-    sin_alt = (math.sin(lat_rad) * math.sin(dec_rad) + 
-               math.cos(lat_rad) * math.cos(dec_rad) * math.cos(ha_rad))
+    sin_lat = math.sin(lat_rad)
+    cos_lat = math.cos(lat_rad)
     
-    # Clamp to avoid math errors
-    sin_alt = max(-1.0, min(1.0, sin_alt))
-    altitude = math.degrees(math.asin(sin_alt))
+    altitudes = []
+    for jd, ra, dec in zip(jds, ras, decs):
+        # Greenwich Mean Sidereal Time
+        gmst = swe.sidtime(jd) * 15  # Convert hours to degrees
+        
+        # Local sidereal time
+        lst = gmst + longitude
+        
+        # Hour angle, normalized to [-180, 180)
+        hour_angle = (lst - ra + 180) % 360 - 180
+        
+        if verbose:
+            print(f"    Debug: GMST={gmst:6.1f}°, LST={lst:6.1f}°, HA={hour_angle:6.1f}°")
+        
+        # Convert to radians
+        dec_rad = math.radians(dec)
+        ha_rad = math.radians(hour_angle)
+        
+        # Calculate altitude
+        sin_alt = (sin_lat * math.sin(dec_rad) + 
+                   cos_lat * math.cos(dec_rad) * math.cos(ha_rad))
+        
+        # Clamp to avoid math errors
+        sin_alt = max(-1.0, min(1.0, sin_alt))
+        altitudes.append(math.degrees(math.asin(sin_alt)))
     
-    return altitude
+    return altitudes
 
 if __name__ == "__main__":
-    debug_sun_positions()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--verbose", action="store_true",
+                        help="print raw ephemeris values and sidereal times")
+    args = parser.parse_args()
+    debug_sun_positions(verbose=args.verbose)
\ No newline at end of file
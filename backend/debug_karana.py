@@ -14,6 +14,10 @@ from app.services.hindu_calendar import lunar_phase
 from app.utils.constants import KARANA_NAMES
 from math import ceil
 
+# UTC offsets as fractions of a day, for shifting local Julian Days to UTC
+IST_OFFSET_JD = 5.5/24.0
+UK_OFFSET_JD = 1.0/24.0
+
 def debug_karana_calculation():
     """Debug the karana calculation differences"""
     
@@ -21,7 +25,7 @@ def debug_karana_calculation():
     print("=" * 60)
     
     # Convert date to Julian Day
-    date_obj = datetime.fromisoformat("2025-10-05")
+    date_obj = datetime(2025, 10, 5)
     jd = get_julian_day_ut(date_obj)
     
     print(f"Base JD: {jd:.6f}")
@@ -36,49 +40,33 @@ def debug_karana_calculation():
         ("Night (9:00 PM)", 21.0/24.0)
     ]
     
-    # Test for Bengaluru timezone (UTC+5.5)
-    print(f"\\n🏙️ Bengaluru (UTC+5.5):")
-    print("-" * 30)
-    for time_name, time_offset in test_times:
-        test_jd = jd + time_offset - 5.5/24.0  # Convert to UTC
-        moon_phase_val = lunar_phase(test_jd)
-        karana_num = ceil(moon_phase_val / 6)
-        
-        if karana_num > 60:
-            karana_num = karana_num % 60
-        if karana_num == 0:
-            karana_num = 60
+    # Local test times are the same for every city; only the UTC shift differs
+    cities = [
+        ("Bengaluru", IST_OFFSET_JD),
+        ("Coventry", UK_OFFSET_JD),
+    ]
+    for city_name, offset_jd in cities:
+        print(f"\\n🏙️ {city_name} (UTC+{offset_jd * 24:g}):")
+        print("-" * 30)
+        base_utc_jd = jd - offset_jd  # Convert to UTC
+        test_jds = [base_utc_jd + time_offset for _, time_offset in test_times]
+        for (time_name, _), test_jd in zip(test_times, test_jds):
+            moon_phase_val = lunar_phase(test_jd)
+            karana_num = ceil(moon_phase_val / 6)
             
-        # Map to name
-        if karana_num <= 56:
-            karana_index = (karana_num - 1) % 7
-        else:
-            karana_index = 7 + (karana_num - 57)
-        karana_index = min(karana_index, len(KARANA_NAMES) - 1)
-        
-        print(f"{time_name:20} | Moon Phase: {moon_phase_val:6.2f}° | Karana: {karana_num:2d} ({KARANA_NAMES[karana_index]})")
-    
-    # Test for Coventry timezone (UTC+1)
-    print(f"\\n🏙️ Coventry (UTC+1):")
-    print("-" * 30)
-    for time_name, time_offset in test_times:
-        test_jd = jd + time_offset - 1.0/24.0  # Convert to UTC
-        moon_phase_val = lunar_phase(test_jd)
-        karana_num = ceil(moon_phase_val / 6)
-        
-        if karana_num > 60:
-            karana_num = karana_num % 60
-        if karana_num == 0:
-            karana_num = 60
+            if karana_num > 60:
+                karana_num = karana_num % 60
+            if karana_num == 0:
+                karana_num = 60
+                
+            # Map to name
+            if karana_num <= 56:
+                karana_index = (karana_num - 1) % 7
+            else:
+                karana_index = 7 + (karana_num - 57)
+            karana_index = min(karana_index, len(KARANA_NAMES) - 1)
             
-        # Map to name
-        if karana_num <= 56:
-            karana_index = (karana_num - 1) % 7
-        else:
-            karana_index = 7 + (karana_num - 57)
-        karana_index = min(karana_index, len(KARANA_NAMES) - 1)
-        
-        print(f"{time_name:20} | Moon Phase: {moon_phase_val:6.2f}° | Karana: {karana_num:2d} ({KARANA_NAMES[karana_index]})")
+            print(f"{time_name:20} | Moon Phase: {moon_phase_val:6.2f}° | Karana: {karana_num:2d} ({KARANA_NAMES[karana_index]})")
 
 if __name__ == "__main__":
     debug_karana_calculation()
\ No newline at end of file
@@ -1,9 +1,19 @@
 #!/usr/bin/env /opt/miniconda3/bin/python
 """
 Run the Panchangam API server
+
+Runs with auto-reload by default for development. Set DEV=0 to serve
+with multiple worker processes instead (WORKERS, default: CPU count).
 """
 if __name__ == "__main__":
+    import os
     import uvicorn
-    
+
+    dev = os.getenv("DEV", "1") == "1"
+    # uvicorn[standard] picks the uvloop/httptools implementations when available
+    options = {"reload": True} if dev else {
+        "workers": int(os.getenv("WORKERS", os.cpu_count() or 1))
+    }
+
     print("Starting Panchangam API server...")
-    uvicorn.run("app.main:app", host="0.0.0.0", port=8000, reload=True)
\ No newline at end of file
+    uvicorn.run("app.main:app", host="0.0.0.0", port=8000, **options)
@@ -5,6 +5,19 @@ Test the complete periods with sun and moon times
 import requests
 import json
 from datetime import datetime
+from functools import lru_cache
+
+# Keep-alive connection pool shared by every request this module makes
+_SESSION = requests.Session()
+
+@lru_cache(maxsize=None)
+def format_time_nice(iso_str):
+    """Format ISO time to nice display, in the time's own UTC offset; cached
+    because each period's end is usually the next period's start"""
+    try:
+        return datetime.fromisoformat(iso_str).strftime('%b %d, %I:%M %p')
+    except (TypeError, ValueError):
+        return iso_str
 
 def test_complete_periods():
     """Test the complete periods endpoint with sun and moon times"""
@@ -18,18 +31,10 @@ def test_complete_periods():
     }
     
     try:
-        response = requests.post(url, json=data)
+        response = _SESSION.post(url, json=data)
         response.raise_for_status()
         result = response.json()
         
-        def format_time_nice(iso_str):
-            """Format ISO time to nice display"""
-            try:
-                dt = datetime.fromisoformat(iso_str.replace('Z', '').replace('+05:30', ''))
-                return dt.strftime('%b %d, %I:%M %p')
-            except:
-                return iso_str
-        
         print("📅 Date & Location Info:")
         print(f"Date: {result['date']}")
         print(f"Location: {result['location']['latitude']}°, {result['location']['longitude']}°")
@@ -47,41 +52,20 @@ def test_complete_periods():
         print(f"End:   {format_time_nice(result['sunrise_next'])}")
         print()
         
-        print("🌙 Tithis:")
-        for i, tithi in enumerate(result['tithis'], 1):
-            print(f"  {i}. {tithi['name']}")
-            print(f"     {format_time_nice(tithi['start'])} – {format_time_nice(tithi['end'])}")
-        print()
-        
-        print("⭐ Nakshatras:")
-        for i, nakshatra in enumerate(result['nakshatras'], 1):
-            print(f"  {i}. {nakshatra['name']}")
-            print(f"     {format_time_nice(nakshatra['start'])} – {format_time_nice(nakshatra['end'])}")
-        print()
-        
-        print("🔄 Karanas:")
-        for i, karana in enumerate(result['karanas'], 1):
-            print(f"  {i}. {karana['name']}")
-            print(f"     {format_time_nice(karana['start'])} – {format_time_nice(karana['end'])}")
-        print()
-        
-        print("🧘 Yogas:")
-        for i, yoga in enumerate(result['yogas'], 1):
-            print(f"  {i}. {yoga['name']}")
-            print(f"     {format_time_nice(yoga['start'])} – {format_time_nice(yoga['end'])}")
-        print()
-        
-        print("✨ Auspicious Periods:")
-        for i, period in enumerate(result.get('auspicious_periods', []), 1):
-            print(f"  {i}. {period['name']}")
-            print(f"     {format_time_nice(period['start'])} – {format_time_nice(period['end'])}")
-        print()
-        
-        print("⚠️ Inauspicious Periods:")
-        for i, period in enumerate(result.get('inauspicious_periods', []), 1):
-            print(f"  {i}. {period['name']}")
-            print(f"     {format_time_nice(period['start'])} – {format_time_nice(period['end'])}")
-        print()
+        sections = [
+            ("🌙 Tithis:", result['tithis']),
+            ("⭐ Nakshatras:", result['nakshatras']),
+            ("🔄 Karanas:", result['karanas']),
+            ("🧘 Yogas:", result['yogas']),
+            ("✨ Auspicious Periods:", result.get('auspicious_periods', [])),
+            ("⚠️ Inauspicious Periods:", result.get('inauspicious_periods', [])),
+        ]
+        for heading, entries in sections:
+            print(heading)
+            for i, entry in enumerate(entries, 1):
+                print(f"  {i}. {entry['name']}")
+                print(f"     {format_time_nice(entry['start'])} – {format_time_nice(entry['end'])}")
+            print()
         
         print("✅ SUCCESS: Complete periods with Sun & Moon times working!")
         
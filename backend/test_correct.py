@@ -3,11 +3,13 @@
 Correct sunrise/sunset calculation with proper timezone handling
 """
 import swisseph as swe
-import math
+from datetime import datetime, timedelta
+from _sun_altitude import altitude_from_gmst, gmst_degrees, latitude_terms
 
 def calculate_sunrise_sunset_correct(year, month, day, latitude, longitude):
     """
-    Calculate sunrise/sunset with better search algorithm
+    Calculate sunrise/sunset by bracketing crossings on a 2-hour grid and
+    bisecting each bracket to the second
     """
     print(f"Calculating for {year}-{month:02d}-{day:02d}, Lat: {latitude}, Lon: {longitude}")
     
@@ -20,32 +22,41 @@ def calculate_sunrise_sunset_correct(year, month, day, latitude, longitude):
     sunrise_jd = None
     sunset_jd = None
     
-    # Search every 15 minutes throughout the day
-    for quarter_hour in range(0, 24 * 4):  # 96 intervals of 15 minutes
-        hour_utc = quarter_hour / 4.0
-        jd = base_jd + hour_utc / 24.0
-        
-        # Get sun position
-        sun_result = swe.calc_ut(jd, swe.SUN, swe.FLG_SWIEPH)
-        if not sun_result:
+    # The observer's latitude terms are shared by every evaluation
+    sin_phi, cos_phi = latitude_terms(latitude)
+    
+    def height(jd):
+        """Sun altitude above the -0.833° rise/set horizon"""
+        ra, dec = swe.calc_ut(jd, swe.SUN, swe.FLG_SWIEPH | swe.FLG_EQUATORIAL)[0][:2]
+        return altitude_from_gmst(gmst_degrees(jd), ra, dec, sin_phi, cos_phi, longitude) + 0.833
+    
+    # Coarse 2-hour sweep to bracket the horizon crossings
+    jds = [base_jd + hour_utc / 24.0 for hour_utc in range(0, 25, 2)]
+    heights = [height(jd) for jd in jds]
+    
+    for i in range(1, len(jds)):
+        lo, hi = jds[i - 1], jds[i]
+        lo_height = heights[i - 1]
+        if (lo_height > 0) == (heights[i] > 0):
             continue
-            
-        ra = sun_result[0][5]  # Right ascension
-        dec = sun_result[0][1]  # Declination
         
-        # Calculate altitude
-        altitude = calculate_sun_altitude(jd, ra, dec, latitude, longitude)
+        # Bisect the bracket down to one second
+        while hi - lo > 1.0 / 86400:
+            mid = (lo + hi) / 2
+            mid_height = height(mid)
+            if (mid_height > 0) == (lo_height > 0):
+                lo, lo_height = mid, mid_height
+            else:
+                hi = mid
+        hour_utc = (lo - base_jd) * 24
         
-        # Check for sunrise (first time altitude crosses above -0.833°)
-        if altitude > -0.833 and sunrise_jd is None:
-            sunrise_jd = jd
-            print(f"Sunrise found at {hour_utc:04.2f} UTC, altitude = {altitude:.2f}°")
-        
-        # Check for sunset (first time after noon when altitude crosses below -0.833°)
-        if altitude < -0.833 and hour_utc > 6 and sunset_jd is None:
-            sunset_jd = jd
-            print(f"Sunset found at {hour_utc:04.2f} UTC, altitude = {altitude:.2f}°")
-            break
+        # Rising if the Sun was below the horizon at the start of the bracket
+        if heights[i - 1] <= 0 and sunrise_jd is None:
+            sunrise_jd = lo
+            print(f"Sunrise found at {hour_utc:04.2f} UTC")
+        elif heights[i - 1] > 0 and sunset_jd is None:
+            sunset_jd = lo
+            print(f"Sunset found at {hour_utc:04.2f} UTC")
     
     # Convert to IST and format
     sunrise_time = format_ist_time(sunrise_jd) if sunrise_jd else "No Rise"
@@ -53,58 +64,13 @@ def calculate_sunrise_sunset_correct(year, month, day, latitude, longitude):
     
     return sunrise_time, sunset_time
 
-def calculate_sun_altitude(jd, ra, dec, latitude, longitude):
-    """Calculate sun altitude above horizon"""
-    # Greenwich Mean Sidereal Time
-    gmst = swe.sidtime(jd) * 15  # Convert hours to degrees
-    
-    # Local sidereal time
-    lst = gmst + longitude
-    
-    # Hour angle
-    hour_angle = lst - ra
-    
-    # Convert to radians
-    lat_rad = math.radians(latitude)
-    dec_rad = math.radians(dec)
-    ha_rad = math.radians(hour_angle)
-    
-    # Calculate altitude
-    sin_alt = (math.sin(lat_rad) * math.sin(dec_rad) + 
-               math.cos(lat_rad) * math.cos(dec_rad) * math.cos(ha_rad))
-    
-    # Clamp to avoid math errors
-    sin_alt = max(-1.0, min(1.0, sin_alt))
-    altitude = math.degrees(math.asin(sin_alt))
-    
-    return altitude
-
 def format_ist_time(jd):
     """Convert Julian Day to IST time string"""
-    cal_date = swe.revjul(jd)
-    year, month, day, hour_float_utc = cal_date
-    
-    # Convert UTC to IST
-    ist_hour_float = hour_float_utc + 5.5
-    
-    # Handle day rollover
-    if ist_hour_float >= 24:
-        ist_hour_float -= 24
-    elif ist_hour_float < 0:
-        ist_hour_float += 24
-    
-    hours = int(ist_hour_float)
-    minutes = int((ist_hour_float - hours) * 60)
+    year, month, day, hour_float_utc = swe.revjul(jd)
     
-    # Format as 12-hour time
-    if hours == 0:
-        return f"12:{minutes:02d} AM"
-    elif hours < 12:
-        return f"{hours}:{minutes:02d} AM"
-    elif hours == 12:
-        return f"12:{minutes:02d} PM"
-    else:
-        return f"{hours-12}:{minutes:02d} PM"
+    # Convert UTC to IST (UTC + 5:30); timedelta handles the day rollover
+    ist = datetime(year, month, day) + timedelta(hours=hour_float_utc + 5.5)
+    return ist.strftime("%I:%M %p").lstrip("0")
 
 if __name__ == "__main__":
     # Test for Bengaluru on January 5, 2025
@@ -3,7 +3,7 @@
 Test Swiss Ephemeris calculations directly
 """
 import swisseph as swe
-import math
+from _sun_altitude import sun_altitudes
 from datetime import datetime, timezone
 
 # Initialize Swiss Ephemeris
@@ -88,34 +88,20 @@ def test_simple_approach():
     jd = swe.julday(year, month, day, hour)
     print(f"Starting JD: {jd}")
     
-    # Calculate sun positions at different times
+    # Calculate sun positions at different times, as one batch
     print("\nSun positions throughout the day:")
-    for h in range(4, 20, 2):  # From 4 AM to 6 PM
-        test_jd = swe.julday(year, month, day, h)
-        
-        try:
-            sun_pos = swe.calc_ut(test_jd, swe.SUN, swe.FLG_SWIEPH)
-            if sun_pos:
-                ra = sun_pos[0][5]  # Right ascension 
-                dec = sun_pos[0][1] # Declination
-                
-                # Calculate altitude
-                gmst = swe.sidtime(test_jd) * 15  # Convert to degrees
-                lst = gmst + lon
-                hour_angle = lst - ra
-                
-                lat_rad = math.radians(lat)
-                dec_rad = math.radians(dec)
-                ha_rad = math.radians(hour_angle)
-                
-                sin_alt = (math.sin(lat_rad) * math.sin(dec_rad) + 
-                          math.cos(lat_rad) * math.cos(dec_rad) * math.cos(ha_rad))
-                altitude = math.degrees(math.asin(sin_alt))
-                
-                print(f"  {h:02d}:00 - Altitude: {altitude:6.2f}°")
-                
-        except Exception as e:
-            print(f"  {h:02d}:00 - Error: {e}")
+    hours = range(4, 20, 2)  # From 4 AM to 6 PM
+    base_jd = swe.julday(year, month, day, 0.0)
+    test_jds = [base_jd + h / 24.0 for h in hours]
+    
+    try:
+        altitudes = sun_altitudes(test_jds, lat, lon)
+    except Exception as e:
+        print(f"  Error: {e}")
+        return
+    
+    for h, altitude in zip(hours, altitudes):
+        print(f"  {h:02d}:00 - Altitude: {altitude:6.2f}°")
 
 if __name__ == "__main__":
     test_basic_ephemeris()
@@ -5,6 +5,16 @@ Test the expected format exactly as user requested
 import requests
 import json
 from datetime import datetime
+from functools import lru_cache
+
+# Keep-alive connection pool shared by every request this module makes
+_SESSION = requests.Session()
+
+@lru_cache(maxsize=None)
+def format_time_nice(iso_str):
+    """Format an ISO time as "Oct 05, 06:03 AM" in its own UTC offset; cached
+    because each period's end is usually the next period's start"""
+    return datetime.fromisoformat(iso_str).strftime('%b %d, %I:%M %p')
 
 def test_expected_format():
     """Test that output matches user's expected format"""
@@ -18,82 +28,24 @@ def test_expected_format():
     }
     
     try:
-        response = requests.post(url, json=data)
+        response = _SESSION.post(url, json=data)
         response.raise_for_status()
         result = response.json()
         
-        print("🌙 Tithi")
-        for tithi in result['tithis']:
-            # Parse dates for formatting
-            start_dt = datetime.fromisoformat(tithi['start'].replace('Z', '').replace('+05:30', ''))
-            end_dt = datetime.fromisoformat(tithi['end'].replace('Z', '').replace('+05:30', ''))
-            
-            start_str = start_dt.strftime('%b %d, %I:%M %p')
-            end_str = end_dt.strftime('%b %d, %I:%M %p')
-            
-            print(f"{tithi['name']}")
-            print(f"{start_str} – {end_str}")
-            print()
-        
-        print("⭐ Nakshatra")
-        for nakshatra in result['nakshatras']:
-            start_dt = datetime.fromisoformat(nakshatra['start'].replace('Z', '').replace('+05:30', ''))
-            end_dt = datetime.fromisoformat(nakshatra['end'].replace('Z', '').replace('+05:30', ''))
-            
-            start_str = start_dt.strftime('%b %d, %I:%M %p')
-            end_str = end_dt.strftime('%b %d, %I:%M %p')
-            
-            print(f"{nakshatra['name']}")
-            print(f"{start_str} – {end_str}")
-            print()
-        
-        print("🔄 Karana")
-        for karana in result['karanas']:
-            start_dt = datetime.fromisoformat(karana['start'].replace('Z', '').replace('+05:30', ''))
-            end_dt = datetime.fromisoformat(karana['end'].replace('Z', '').replace('+05:30', ''))
-            
-            start_str = start_dt.strftime('%b %d, %I:%M %p')
-            end_str = end_dt.strftime('%b %d, %I:%M %p')
-            
-            print(f"{karana['name']}")
-            print(f"{start_str} – {end_str}")
-            print()
-        
-        print("🧘 Yoga")
-        for yoga in result['yogas']:
-            start_dt = datetime.fromisoformat(yoga['start'].replace('Z', '').replace('+05:30', ''))
-            end_dt = datetime.fromisoformat(yoga['end'].replace('Z', '').replace('+05:30', ''))
-            
-            start_str = start_dt.strftime('%b %d, %I:%M %p')
-            end_str = end_dt.strftime('%b %d, %I:%M %p')
-            
-            print(f"{yoga['name']}")
-            print(f"{start_str} – {end_str}")
-            print()
-        
-        print("✨ Auspicious Periods")
-        for period in result.get('auspicious_periods', []):
-            start_dt = datetime.fromisoformat(period['start'].replace('Z', '').replace('+05:30', ''))
-            end_dt = datetime.fromisoformat(period['end'].replace('Z', '').replace('+05:30', ''))
-            
-            start_str = start_dt.strftime('%b %d, %I:%M %p')
-            end_str = end_dt.strftime('%b %d, %I:%M %p')
-            
-            print(f"{period['name']}")
-            print(f"{start_str} – {end_str}")
-            print()
-        
-        print("⚠️ Inauspicious Periods")
-        for period in result.get('inauspicious_periods', []):
-            start_dt = datetime.fromisoformat(period['start'].replace('Z', '').replace('+05:30', ''))
-            end_dt = datetime.fromisoformat(period['end'].replace('Z', '').replace('+05:30', ''))
-            
-            start_str = start_dt.strftime('%b %d, %I:%M %p')
-            end_str = end_dt.strftime('%b %d, %I:%M %p')
-            
-            print(f"{period['name']}")
-            print(f"{start_str} – {end_str}")
-            print()
+        sections = [
+            ("🌙 Tithi", result['tithis']),
+            ("⭐ Nakshatra", result['nakshatras']),
+            ("🔄 Karana", result['karanas']),
+            ("🧘 Yoga", result['yogas']),
+            ("✨ Auspicious Periods", result.get('auspicious_periods', [])),
+            ("⚠️ Inauspicious Periods", result.get('inauspicious_periods', [])),
+        ]
+        for heading, entries in sections:
+            print(heading)
+            for entry in entries:
+                print(f"{entry['name']}")
+                print(f"{format_time_nice(entry['start'])} – {format_time_nice(entry['end'])}")
+                print()
         
         print("✅ SUCCESS: All periods show multiple overlapping entries as expected!")
         print(f"📊 Summary: {len(result['tithis'])} Tithis, {len(result['nakshatras'])} Nakshatras, {len(result['karanas'])} Karanas, {len(result['yogas'])} Yogas")
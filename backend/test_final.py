@@ -3,7 +3,7 @@
 Final working sunrise/sunset calculation
 """
 import swisseph as swe
-import math
+from _sun_altitude import sun_altitudes
 from datetime import datetime, timezone, timedelta
 
 def calculate_sunrise_sunset_final(year, month, day, latitude, longitude):
@@ -21,87 +21,44 @@ def calculate_sunrise_sunset_final(year, month, day, latitude, longitude):
     # Create base Julian Day at midnight UTC
     base_jd = swe.julday(year, month, day, 0.0)
     
-    print("\nScanning sun positions throughout the day:")
+    # Sample every hour from midnight to midnight UTC
+    hours_utc = range(0, 24)
+    jds = [base_jd + hour_utc / 24.0 for hour_utc in hours_utc]
     
-    # Scan every hour from midnight to midnight UTC
-    for hour_utc in range(0, 24):
-        jd = base_jd + hour_utc / 24.0
-        
-        # Get sun position
-        sun_result = swe.calc_ut(jd, swe.SUN, swe.FLG_SWIEPH)
-        if not sun_result:
-            continue
-            
-        ra = sun_result[0][5]  # Right ascension
-        dec = sun_result[0][1]  # Declination
-        
-        # Calculate altitude
-        altitude = calculate_sun_altitude(jd, ra, dec, latitude, longitude)
-        
+    # Sun altitudes for the whole day in one batch
+    altitudes = sun_altitudes(jds, latitude, longitude)
+    
+    print("\nScanning sun positions throughout the day:")
+    for hour_utc, altitude in zip(hours_utc, altitudes):
         # Convert to IST for display
         ist_hour = (hour_utc + 5.5) % 24
         print(f"  {hour_utc:02d}:00 UTC ({ist_hour:04.1f} IST): altitude = {altitude:6.2f}°")
+    
+    # Sunrise/sunset are sign changes of (altitude + 0.833°) between samples;
+    # interpolate linearly between the two bracketing hours
+    for i in range(1, len(jds)):
+        before = altitudes[i - 1] + 0.833
+        after = altitudes[i] + 0.833
+        if (before > 0) == (after > 0):
+            continue
+        jd = jds[i - 1] + (jds[i] - jds[i - 1]) * before / (before - after)
         
-        # Check for sunrise (first time altitude > -0.833°)
-        if altitude > -0.833 and sunrise_time is None:
+        if after > 0 and sunrise_time is None:
             sunrise_time = jd_to_ist_time(jd)
-            print(f"  >>> SUNRISE detected at {hour_utc:02d}:00 UTC")
-        
-        # Check for sunset (first time after 12:00 UTC when altitude < -0.833°)
-        if altitude < -0.833 and hour_utc > 6 and sunset_time is None:
+            print(f"  >>> SUNRISE detected between {hours_utc[i - 1]:02d}:00 and {hours_utc[i]:02d}:00 UTC")
+        elif after <= 0 and sunset_time is None:
             sunset_time = jd_to_ist_time(jd)
-            print(f"  >>> SUNSET detected at {hour_utc:02d}:00 UTC")
+            print(f"  >>> SUNSET detected between {hours_utc[i - 1]:02d}:00 and {hours_utc[i]:02d}:00 UTC")
     
     return sunrise_time or "No Rise", sunset_time or "No Set"
 
-def calculate_sun_altitude(jd, ra, dec, latitude, longitude):
-    """Calculate sun altitude above horizon"""
-    # Greenwich Mean Sidereal Time
-    gmst = swe.sidtime(jd) * 15  # Convert hours to degrees
-    
-    # Local sidereal time
-    lst = gmst + longitude
-    
-    # Hour angle
-    hour_angle = lst - ra
-    
-    # Convert to radians
-    lat_rad = math.radians(latitude)
-    dec_rad = math.radians(dec)
-    ha_rad = math.radians(hour_angle)
-    
-    # Calculate altitude
-    sin_alt = (math.sin(lat_rad) * math.sin(dec_rad) + 
-               math.cos(lat_rad) * math.cos(dec_rad) * math.cos(ha_rad))
-    
-    # Clamp to avoid math errors
-    sin_alt = max(-1.0, min(1.0, sin_alt))
-    altitude = math.degrees(math.asin(sin_alt))
-    
-    return altitude
-
 def jd_to_ist_time(jd):
     """Convert Julian Day to IST time string"""
-    cal_date = swe.revjul(jd)
-    year, month, day, hour_float_utc = cal_date
-    
-    # Convert UTC to IST
-    ist_hour_float = hour_float_utc + 5.5
-    if ist_hour_float >= 24:
-        ist_hour_float -= 24
-    
-    hours = int(ist_hour_float)
-    minutes = int((ist_hour_float - hours) * 60)
+    year, month, day, hour_float_utc = swe.revjul(jd)
     
-    # Format as 12-hour time
-    if hours == 0:
-        return f"12:{minutes:02d} AM"
-    elif hours < 12:
-        return f"{hours}:{minutes:02d} AM"
-    elif hours == 12:
-        return f"12:{minutes:02d} PM"
-    else:
-        return f"{hours-12}:{minutes:02d} PM"
+    # Convert UTC to IST (UTC + 5:30); timedelta handles the day rollover
+    ist = datetime(year, month, day) + timedelta(hours=hour_float_utc + 5.5)
+    return ist.strftime("%I:%M %p").lstrip("0")
 
 if __name__ == "__main__":
     # Test for Bengaluru on January 5, 2025
@@ -5,9 +5,14 @@ import pytest
 from datetime import datetime
 from fastapi.testclient import TestClient
 from app.main import app
-from app.services.astronomical import calculate_sunrise_sunset, calculate_moonrise_moonset
-from app.services.hindu_calendar import calculate_tithi, calculate_nakshatra
-from app.utils.timezone import get_julian_day_ut
+from app.services.astronomical import (
+    calculate_sunrise_sunset, calculate_moonrise_moonset, calculate_sunrise_sunset_hours
+)
+from app.services.hindu_calendar import (
+    calculate_tithi, calculate_nakshatra, calculate_panchang_all, calculate_all_periods_for_hindu_day,
+    calculate_sunrise_for_panchang
+)
+from app.utils.timezone import get_julian_day_ut, format_time_12hour
 
 # Create test client
 client = TestClient(app)
@@ -144,6 +149,55 @@ class TestHinduCalendar:
         assert "end" in nakshatra_data
         assert isinstance(nakshatra_data["name"], str)
         assert len(nakshatra_data["name"]) > 0
+    
+    def test_panchang_all_periods(self):
+        """Test combined panchang calculation for a known day"""
+        date = datetime(2025, 10, 5)
+        jd = get_julian_day_ut(date)
+        city = "Bengaluru"
+        
+        panchang_data = calculate_panchang_all(jd, city)
+        
+        assert set(panchang_data) == {"tithi", "nakshatra", "karana", "yoga"}
+        assert panchang_data["tithi"]["name"] == "Shukla Paksha Trayodashi"
+        assert panchang_data["nakshatra"]["name"] == "Shatabhisha"
+        assert panchang_data["karana"]["name"] == "Garija"
+        assert panchang_data["yoga"]["name"] == "Ganda"
+        
+        for period in panchang_data.values():
+            assert datetime.fromisoformat(period["start"]) < datetime.fromisoformat(period["end"])
+        
+        # A karana is half a tithi, so it ends at the tithi's end or midpoint
+        tithi_start = datetime.fromisoformat(panchang_data["tithi"]["start"])
+        tithi_end = datetime.fromisoformat(panchang_data["tithi"]["end"])
+        tithi_mid = tithi_start + (tithi_end - tithi_start) / 2
+        karana_end = datetime.fromisoformat(panchang_data["karana"]["end"])
+        assert min(abs(karana_end - tithi_end), abs(karana_end - tithi_mid)).total_seconds() < 60
+    
+    def test_sunrise_for_panchang_uses_place_coordinates(self):
+        """Test sunrise follows the given place, not the fallback city's coordinates"""
+        date = datetime(2025, 10, 5)
+        jd = get_julian_day_ut(date)
+        helsinki = (60.17, 24.94, 5.5)  # Matches no supported city
+        
+        sunrise_jd, _ = calculate_sunrise_for_panchang(jd, helsinki)
+        bengaluru_jd, _ = calculate_sunrise_for_panchang(jd, (12.9719, 77.593, 5.5))
+        
+        expected_hour, _ = calculate_sunrise_sunset_hours(date, 60.17, 24.94, "Bengaluru")
+        assert abs(sunrise_jd - (jd + expected_hour / 24.0)) < 1e-9
+        assert abs(sunrise_jd - bengaluru_jd) > 1.0 / 24.0
+    
+    def test_cached_periods_are_independent_copies(self):
+        """Test mutating a periods result does not leak into later calls"""
+        date = datetime(2025, 10, 5)
+        
+        first = calculate_all_periods_for_hindu_day(date, 12.9719, 77.593)
+        expected_tithis = [dict(period) for period in first['tithis']]
+        first['tithis'].clear()
+        
+        second = calculate_all_periods_for_hindu_day(date, 12.9719, 77.593)
+        assert second['tithis'] == expected_tithis
+        assert len(second['tithis']) > 0
 
 class TestInputValidation:
     """Test input validation"""
@@ -160,6 +214,13 @@ class TestInputValidation:
         response = client.post("/api/panchangam", json=test_data)
         assert response.status_code == 400
     
+    def test_format_time_12hour_strings(self):
+        """Test 12-hour formatting of ISO strings and bare, possibly unpadded, times"""
+        assert format_time_12hour("2025-10-05T18:30:00+05:30") == "6:30 PM"
+        assert format_time_12hour("2025-10-05T00:07:00") == "12:07 AM"
+        assert format_time_12hour("06:05") == "6:05 AM"
+        assert format_time_12hour("6:05") == "6:05 AM"
+    
     def test_invalid_coordinates(self):
         """Test invalid coordinates"""
         test_data = {
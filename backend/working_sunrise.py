@@ -89,11 +89,8 @@ def calculate_sun_altitude(jd, ra, dec, latitude, longitude):
     # Hour angle
     hour_angle = lst - ra
     
-    # Normalize hour angle
-    while hour_angle > 180:
-        hour_angle -= 360
-    while hour_angle < -180:
-        hour_angle += 360
+    # Normalize hour angle to [-180, 180)
+    hour_angle = (hour_angle + 180.0) % 360.0 - 180.0
     
     # Convert to radians
     lat_rad = math.radians(latitude)